@@ -72,13 +72,14 @@ def initialize() -> bool:
     initialize_config()
     
     # Try to find cities.csv in standard locations
-    standard_locations: List[str] = [
-        os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'cities.csv'),
-        os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data', 'cities.csv'),
-    ]
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    standard_locations: Tuple[str, ...] = (
+        os.path.join(package_dir, 'data', 'cities.csv'),
+        os.path.join(package_dir, '..', 'data', 'cities.csv'),
+    )
     
     for path in standard_locations:
-        if os.path.exists(path):
+        if os.path.isfile(path):
             logger.debug(f"City data found at {path}")
             return True
     
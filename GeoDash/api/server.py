@@ -406,9 +406,19 @@ def validate_params(required_params: Optional[List[str]] = None,
                     limit = int(params['limit'])
                     if limit > max_limit:
                         errors.append(f"Limit exceeds maximum of {max_limit}")
+                    elif limit < 0:
+                        errors.append("Limit must not be negative")
                 except ValueError:
                     errors.append("Limit must be an integer")
             
+            # Check offset parameter
+            if 'offset' in params and params['offset']:
+                try:
+                    if int(params['offset']) < 0:
+                        errors.append("Offset must not be negative")
+                except ValueError:
+                    errors.append("Offset must be an integer")
+            
             # If there are validation errors, raise InvalidParameterError
             if errors:
                 raise InvalidParameterError(
@@ -627,12 +637,14 @@ def register_routes(app: Flask) -> None:
             lng: Longitude value (-180 to 180)
             radius_km: Search radius in kilometers (default: 10)
             limit: Maximum number of results (default: 10)
+            offset: Number of nearest results to skip, for pagination (default: 0)
         """
         try:
             lat = float(request.args.get('lat'))
             lng = float(request.args.get('lng'))
             radius_km = float(request.args.get('radius_km', 10))
             limit = min(int(request.args.get('limit', 10)), 50)
+            offset = int(request.args.get('offset') or 0)
             
             # Validate coordinate ranges
             if not -90 <= lat <= 90:
@@ -665,13 +677,11 @@ def register_routes(app: Flask) -> None:
             cities = city_service.get_cities_by_coordinates(
                 lat=lat,
                 lng=lng,
-                radius_km=radius_km
+                radius_km=radius_km,
+                limit=limit,
+                offset=offset
             )
             
-            # Limit the results if requested
-            if limit < len(cities):
-                cities = cities[:limit]
-            
             return {
                 'center': {
                     'lat': lat,
@@ -679,6 +689,7 @@ def register_routes(app: Flask) -> None:
                 },
                 'radius_km': radius_km,
                 'limit': limit,
+                'offset': offset,
                 'count': len(cities),
                 'cities': cities
             }
@@ -765,30 +776,23 @@ def register_routes(app: Flask) -> None:
             state: State name
             country: Country name
             limit: Maximum number of results (default: all cities)
+            offset: Number of results to skip, for pagination (default: 0)
         """
         state = request.args.get('state', '')
         country = request.args.get('country', '')
+        
         limit_str = request.args.get('limit')
+        limit = min(int(limit_str), 100) if limit_str else None
+        offset = int(request.args.get('offset') or 0)
         
         city_service = get_city_service()
         cities = city_service.get_cities_in_state(
             state=state,
-            country=country
+            country=country,
+            limit=limit,
+            offset=offset
         )
         
-        # Apply limit if specified
-        if limit_str:
-            try:
-                limit = min(int(limit_str), 100)
-                if limit < len(cities):
-                    cities = cities[:limit]
-            except ValueError:
-                return format_response(
-                    error='Invalid Parameter',
-                    message=f"limit must be a valid integer, got {limit_str}",
-                    status_code=400
-                )
-        
         return {
             'state': state,
             'country': country,
@@ -809,24 +813,19 @@ def register_routes(app: Flask) -> None:
             
         Query parameters:
             limit: Maximum number of results (default: all cities)
+            offset: Number of results to skip, for pagination (default: 0)
         """
         limit_str = request.args.get('limit')
+        limit = min(int(limit_str), 100) if limit_str else None
+        offset = int(request.args.get('offset') or 0)
         
         city_service = get_city_service()
-        cities = city_service.get_cities_in_state(state=state, country=country)
-        
-        # Apply limit if specified
-        if limit_str:
-            try:
-                limit = min(int(limit_str), 100)
-                if limit < len(cities):
-                    cities = cities[:limit]
-            except ValueError:
-                return format_response(
-                    error='Invalid Parameter',
-                    message=f"limit must be a valid integer, got {limit_str}",
-                    status_code=400
-                )
+        cities = city_service.get_cities_in_state(
+            state=state,
+            country=country,
+            limit=limit,
+            offset=offset
+        )
         
         return {
             'country': country,
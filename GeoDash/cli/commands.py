@@ -194,7 +194,7 @@ def cities_in_state_command(state, country, db_uri, log_level):
 
 @cli.command('import')
 @click.option('--csv-path', help='Path to CSV file (optional)')
-@click.option('--batch-size', type=int, default=5000, help='Batch size for import (default: 5000)')
+@click.option('--batch-size', type=int, default=None, help='Batch size for import (default: data.batch_size from the configuration)')
 @db_uri_option
 @log_level_option
 def import_data_command(csv_path, batch_size, db_uri, log_level):
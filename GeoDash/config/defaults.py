@@ -65,7 +65,10 @@ SEARCH_DEFAULTS: Dict[str, Any] = {
         # Fuzzy matching threshold (0-100, higher values require closer matches)
         "threshold": 70,
         # Enable fuzzy matching
-        "enabled": True
+        "enabled": True,
+        # Scorer for background fuzzy matching (auto, ratio, QRatio, WRatio or
+        # token_set_ratio); auto uses ratio for short queries and WRatio otherwise
+        "scorer": "auto"
     },
     # Location-aware search configuration
     "location_aware": {
@@ -83,7 +86,9 @@ SEARCH_DEFAULTS: Dict[str, Any] = {
         # Maximum number of entries in the cache
         "size": 5000,
         # Cache time-to-live in seconds
-        "ttl": 3600
+        "ttl": 3600,
+        # Also store results in the database so they survive restarts
+        "persistent": False
     },
     # Search result limits
     "limits": {
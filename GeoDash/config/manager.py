@@ -401,11 +401,12 @@ class ConfigManager:
         Returns a dictionary with fuzzy search configuration parameters.
         
         Returns:
-            Dict[str, Any]: Dictionary with fuzzy search settings (threshold, enabled)
+            Dict[str, Any]: Dictionary with fuzzy search settings (threshold, enabled, scorer)
         """
         return {
             "threshold": self.get("search.fuzzy.threshold", 70),
-            "enabled": self.get("search.fuzzy.enabled", True)
+            "enabled": self.get("search.fuzzy.enabled", True),
+            "scorer": self.get("search.fuzzy.scorer", "auto")
         }
     
     def get_location_settings(self) -> Dict[str, Any]:
@@ -430,12 +431,13 @@ class ConfigManager:
         Returns a dictionary with search cache configuration parameters.
         
         Returns:
-            Dict[str, Any]: Dictionary with cache settings (enabled, size, ttl)
+            Dict[str, Any]: Dictionary with cache settings (enabled, size, ttl, persistent)
         """
         return {
             "enabled": self.get("search.cache.enabled", True),
             "size": self.get("search.cache.size", 5000),
-            "ttl": self.get("search.cache.ttl", 3600)
+            "ttl": self.get("search.cache.ttl", 3600),
+            "persistent": self.get("search.cache.persistent", False)
         }
     
     def get_search_limits(self) -> Dict[str, int]:
@@ -1,4 +1,4 @@
-from typing import TypedDict, Literal, Optional, Dict, Any, Union, List
+from typing import TypedDict, Literal, Optional, Dict, Any, Union, List, Tuple
 import re
 import os
 from pathlib import Path
@@ -8,6 +8,10 @@ DatabaseType = Literal["sqlite", "postgresql"]
 LoggingLevel = Literal["debug", "info", "warning", "error", "critical"]
 LoggingFormat = Literal["json", "text"]
 GeoDashMode = Literal["simple", "advanced"]
+FuzzyScorer = Literal["auto", "ratio", "QRatio", "WRatio", "token_set_ratio"]
+
+# Allowed values of search.fuzzy.scorer, matching FuzzyScorer
+FUZZY_SCORERS: Tuple[str, ...] = ("auto", "ratio", "QRatio", "WRatio", "token_set_ratio")
 
 class SQLiteConfig(TypedDict):
     """TypedDict for SQLite configuration validation"""
@@ -42,6 +46,7 @@ class FuzzySearchConfig(TypedDict):
     """TypedDict for fuzzy search configuration validation"""
     threshold: int
     enabled: bool
+    scorer: FuzzyScorer
 
 class LocationAwareConfig(TypedDict):
     """TypedDict for location-aware search configuration validation"""
@@ -54,6 +59,7 @@ class SearchCacheConfig(TypedDict):
     enabled: bool
     size: int
     ttl: int
+    persistent: bool
 
 class SearchLimitsConfig(TypedDict):
     """TypedDict for search limits configuration validation"""
@@ -134,6 +140,10 @@ def is_valid_logging_format(fmt: str) -> bool:
     """Validate the logging format against allowed values"""
     return fmt in ("json", "text")
 
+def is_valid_fuzzy_scorer(scorer: str) -> bool:
+    """Validate the fuzzy matching scorer against allowed values"""
+    return scorer in FUZZY_SCORERS
+
 def is_valid_mode(mode: str) -> bool:
     """Validate the GeoDash mode against allowed values"""
     return mode in ("simple", "advanced")
@@ -396,6 +406,13 @@ def validate_search_config(search_config: Dict[str, Any]) -> List[str]:
         # Validate enabled flag
         if "enabled" in fuzzy_config and not isinstance(fuzzy_config["enabled"], bool):
             errors.append("Fuzzy search enabled flag must be a boolean")
+        
+        # Validate scorer
+        if "scorer" in fuzzy_config and not is_valid_fuzzy_scorer(fuzzy_config["scorer"]):
+            errors.append(
+                f"Fuzzy scorer must be one of {', '.join(FUZZY_SCORERS)}, "
+                f"got {fuzzy_config['scorer']}"
+            )
     
     # Validate location-aware settings
     if "location_aware" in search_config and isinstance(search_config["location_aware"], dict):
@@ -437,6 +454,10 @@ def validate_search_config(search_config: Dict[str, Any]) -> List[str]:
                 errors.append("Cache TTL must be an integer")
             elif cache_config["ttl"] < 60 or cache_config["ttl"] > 86400:
                 errors.append(f"Cache TTL must be between 60 and 86400 seconds (1 day), got {cache_config['ttl']}")
+        
+        # Validate persistent flag
+        if "persistent" in cache_config and not isinstance(cache_config["persistent"], bool):
+            errors.append("Cache persistent flag must be a boolean")
     
     # Validate limits settings
     if "limits" in search_config and isinstance(search_config["limits"], dict):
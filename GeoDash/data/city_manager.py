@@ -7,7 +7,6 @@ city data through various repositories.
 
 import os
 from typing import Dict, List, Any, Optional, Union, Tuple, TypeVar, Iterator, Type, cast, overload, Set, Callable, Protocol
-from functools import lru_cache
 
 from GeoDash.data.database import DatabaseManager
 from GeoDash.data.schema import SchemaManager
@@ -84,8 +83,7 @@ class CityData:
             
             # Check if database is empty and try to import data if needed
             try:
-                count = self.get_table_info()['row_count']
-                if count == 0:
+                if not self.schema_manager.has_city_data():
                     logger.info("Database is empty. Attempting to import city data...")
                     self.import_city_data()
             except Exception as e:
@@ -112,9 +110,8 @@ class CityData:
         """
         try:
             # First check if we already have data
-            count = self.get_table_info().get('row_count', 0)
-            if count > 0:
-                logger.info(f"Database already contains {count} cities. Import not needed.")
+            if self.schema_manager.has_city_data():
+                logger.info("Database already contains city data. Import not needed.")
                 return True
                 
             # Get batch size from config if not provided
@@ -128,6 +125,7 @@ class CityData:
             # Filter cities by country if needed
             if imported > 0:
                 self._filter_by_countries()
+                self._clear_repository_caches()
                 
             return imported > 0
         except Exception as e:
@@ -140,9 +138,8 @@ class CityData:
                     logger.info(f"Retrying import with freshly downloaded data: {csv_path}")
                     
                     # Clear the database first
-                    with self.db_manager.cursor() as cursor:
-                        cursor.execute(f"DELETE FROM city_data")
-                        logger.info("Cleared existing data before retrying import")
+                    self.db_manager.clear_table('city_data')
+                    logger.info("Cleared existing data before retrying import")
                     
                     # Get batch size from config if not provided
                     if batch_size is None:
@@ -153,12 +150,20 @@ class CityData:
                     # Filter cities by country if needed
                     if imported > 0:
                         self._filter_by_countries()
+                        self._clear_repository_caches()
                         
                     return imported > 0
                 except Exception as download_err:
                     logger.error(f"Error during retry with explicit download: {str(download_err)}")
             return False
     
+    def _clear_repository_caches(self) -> None:
+        """
+        Drop cached repository query results after the city data has changed.
+        """
+        for repository in (self.city_repository, self.geo_repository, self.region_repository):
+            repository.clear_caches()
+    
     def _filter_by_countries(self) -> None:
         """
         Filter cities by enabled countries from configuration.
@@ -187,7 +192,6 @@ class CityData:
                 else:
                     logger.info("No cities needed to be removed during country filtering")
     
-    @lru_cache(maxsize=5000)
     def search_cities(
         self, 
         query: str, 
@@ -246,7 +250,6 @@ class CityData:
             fuzzy_threshold=fuzzy_threshold if fuzzy_enabled else None
         )
     
-    @lru_cache(maxsize=1000)
     def get_city(self, city_id: int) -> Optional[Dict[str, Any]]:
         """
         Get a city by its ID.
@@ -263,7 +266,9 @@ class CityData:
         self, 
         lat: float, 
         lng: float, 
-        radius_km: float = 10
+        radius_km: float = 10,
+        limit: Optional[int] = None,
+        offset: int = 0
     ) -> List[Dict[str, Any]]:
         """
         Find cities within a given radius from the specified coordinates.
@@ -272,48 +277,55 @@ class CityData:
             lat: Latitude of the center point
             lng: Longitude of the center point
             radius_km: Search radius in kilometers (default: 10)
+            limit: Maximum number of cities to return (default: all)
+            offset: Number of nearest cities to skip, for pagination
             
         Returns:
             List of cities within the radius, ordered by distance
         """
-        return self.geo_repository.find_by_coordinates(lat, lng, radius_km)
+        return self.geo_repository.find_by_coordinates(lat, lng, radius_km, limit, offset)
     
-    @lru_cache(maxsize=1)
-    def get_countries(self) -> List[str]:
+    def get_countries(self) -> Tuple[str, ...]:
         """
-        Get a list of all countries.
+        Get all countries.
         
         Returns:
-            List of country names, sorted alphabetically
+            Tuple of country names, sorted alphabetically
         """
         return self.region_repository.get_countries()
     
-    @lru_cache(maxsize=100)
-    def get_states(self, country: str) -> List[str]:
+    def get_states(self, country: str) -> Tuple[str, ...]:
         """
-        Get a list of states in a country.
+        Get the states in a country.
         
         Args:
             country: Country name
             
         Returns:
-            List of state names, sorted alphabetically
+            Tuple of state names, sorted alphabetically
         """
         return self.region_repository.get_states(country)
     
-    @lru_cache(maxsize=500)
-    def get_cities_in_state(self, state: str, country: str) -> List[Dict[str, Any]]:
+    def get_cities_in_state(
+        self, 
+        state: str, 
+        country: str,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
         """
         Get a list of cities in a state.
         
         Args:
             state: State name
             country: Country name
+            limit: Maximum number of cities to return (default: all)
+            offset: Number of cities to skip, for pagination
             
         Returns:
             List of cities in the state, sorted by name
         """
-        return self.region_repository.get_cities_in_state(state, country)
+        return self.region_repository.get_cities_in_state(state, country, limit, offset)
     
     def get_table_info(self) -> Dict[str, Any]:
         """
@@ -538,13 +538,7 @@ class DatabaseManager:
                 port = port or 5432
                 
                 # Additional connection parameters for performance
-                conn_params = {}
-                if self.use_advanced_features:
-                    conn_params.update({
-                        'application_name': 'GeoDash',
-                        'client_encoding': 'utf8',
-                        'options': '-c statement_timeout=30000'  # 30 seconds timeout
-                    })
+                conn_params = self.connection_options
                 
                 # Connect to the database
                 connection = psycopg2.connect(
@@ -622,6 +616,30 @@ class DatabaseManager:
                 context={"db_uri": self.db_uri}
             )
     
+    @contextmanager
+    def raw_connection(self) -> Iterator[Any]:
+        """
+        Hand out a database connection for work that manages its own transactions.
+        
+        Unlike cursor(), nothing is committed or rolled back on exit. The
+        connection is returned to the pool, kept if it is the persistent
+        connection, or closed otherwise.
+        
+        Yields:
+            Database connection object
+        """
+        connection = self._get_connection()
+        try:
+            yield connection
+        finally:
+            if self.connection_pool is not None:
+                self.connection_pool.return_connection(connection)
+            elif not self.persistent:
+                try:
+                    connection.close()
+                except Exception as e:
+                    logger.warning(f"Error closing connection: {str(e)}")
+    
     def close(self) -> None:
         """
         Close the database connection and release resources.
@@ -692,6 +710,60 @@ class DatabaseManager:
                 logger.error(f"Error creating table {table_name}: {str(e)}")
                 raise DatabaseError(f"Error creating table {table_name}: {str(e)}") from e
     
+    @property
+    def connection_options(self) -> Dict[str, str]:
+        """
+        Extra libpq parameters applied to new PostgreSQL connections.
+        
+        Returns:
+            Parameter names mapped to their values, empty unless advanced
+            database features are enabled
+        """
+        if not self.use_advanced_features:
+            return {}
+        return {
+            'application_name': 'GeoDash',
+            'client_encoding': 'utf8',
+            'options': '-c statement_timeout=30000'  # 30 seconds timeout
+        }
+    
+    @property
+    def recommended_batch_size(self) -> int:
+        """
+        Default number of rows to insert per batch for this database type.
+        
+        PostgreSQL gains little past about a thousand rows per statement,
+        while SQLite keeps getting faster with larger batches.
+        
+        Returns:
+            Recommended import batch size
+        """
+        return 1000 if self.db_type == 'postgresql' else 10000
+    
+    def clear_table(self, table_name: str) -> None:
+        """
+        Remove all rows from a table.
+        
+        PostgreSQL uses TRUNCATE, which replaces the table storage instead of
+        deleting and later vacuuming every row.
+        
+        Args:
+            table_name: Name of the table to clear
+            
+        Raises:
+            DatabaseError: If there's an error clearing the table
+        """
+        with self.cursor() as cursor:
+            try:
+                if self.db_type == 'postgresql':
+                    cursor.execute(f"TRUNCATE TABLE {table_name} RESTART IDENTITY")
+                else:
+                    cursor.execute(f"DELETE FROM {table_name}")
+                logger.info(f"Cleared table: {table_name}")
+            except Exception as e:
+                logger.error(f"Error clearing table {table_name}: {str(e)}")
+                raise DatabaseError(f"Error clearing table {table_name}: {str(e)}") from e
+    
     def create_index(self, index_name: str, table_name: str, columns: List[str], unique: bool = False) -> None:
         """
         Create an index on a table.
@@ -742,6 +814,9 @@ class DatabaseManager:
         """
         Execute a SQL query with multiple parameter sets.
         
+        On PostgreSQL the statements are sent in pages with execute_batch, as
+        psycopg2's executemany waits for a server round trip per parameter set.
+        
         Args:
             query: SQL query to execute
             params_list: List of query parameter tuples
@@ -751,7 +826,11 @@ class DatabaseManager:
         """
         with self.cursor() as cursor:
             try:
-                cursor.executemany(query, params_list)
+                if self.db_type == 'postgresql':
+                    from psycopg2.extras import execute_batch
+                    execute_batch(cursor, query, params_list, page_size=self.recommended_batch_size)
+                else:
+                    cursor.executemany(query, params_list)
             except Exception as e:
                 logger.error(f"Error executing batch query: {str(e)}")
                 raise QueryError(f"Error executing batch query: {str(e)}") from e
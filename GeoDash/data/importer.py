@@ -6,20 +6,212 @@ into the GeoDash database.
 """
 
 import os
+import logging
+import functools
 import time
+import gzip
+import json
+import shutil
+import hashlib
+import unicodedata
+import queue
+import threading
+import csv
+import io
+import socket
+import numpy as np
 import pandas as pd
+import http.client
+import urllib.error
+import urllib.parse
 import urllib.request
 import sys
-from typing import Dict, List, Any, Optional, Tuple, Union, Set, Iterator, TextIO, cast
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from contextlib import contextmanager, nullcontext
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple, Union, Set, Iterator, TextIO, cast
 from pathlib import Path
 
 from GeoDash.data.database import DatabaseManager
+from GeoDash.data.schema import CITY_INDEXES, POSTGRESQL_CUSTOM_INDEXES
 from GeoDash.exceptions import DataImportError, DataNotFoundError, ValidationError
 from GeoDash.utils.logging import get_logger
 
 # Get a logger for this module
 logger = get_logger(__name__)
 
+# For faster CSV parsing (pyarrow parses blocks in parallel into columnar buffers)
+# charset-normalizer is only needed for CSV files that are not UTF-8
+try:
+    from charset_normalizer import from_bytes as charset_from_bytes
+    USING_CHARSET_NORMALIZER = True
+except ImportError:
+    USING_CHARSET_NORMALIZER = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.feather as pa_feather
+    USING_PYARROW = True
+except ImportError:
+    USING_PYARROW = False
+    logger.warning("pyarrow not found, using slower pandas CSV parser. Install pyarrow for faster imports.")
+
+# The ADBC PostgreSQL driver ingests Arrow tables with binary COPY, skipping the
+# per-value conversion to Python objects and CSV text
+try:
+    import adbc_driver_postgresql.dbapi as adbc_postgresql
+    USING_ADBC_POSTGRESQL = USING_PYARROW
+except ImportError:
+    USING_ADBC_POSTGRESQL = False
+
+# Columns written to city_data by the importer, in INSERT order
+IMPORT_COLUMNS: Tuple[str, ...] = (
+    'id', 'name', 'ascii_name', 'state_id', 'state_code', 'state_name', 'state',
+    'country_id', 'country_code', 'country_name', 'country',
+    'lat', 'lng', 'wikidata_id', 'population', 'timezone'
+)
+
+# Nullable integer columns and the dtype each is narrowed to before insertion
+_INTEGER_COLUMN_TYPES: Dict[str, str] = {
+    'state_id': 'Int32',
+    'country_id': 'Int32',
+    'population': 'Int32'
+}
+
+# SQLite settings applied for the duration of an import. The data can always be
+# re-imported from the CSV, so durability is traded for write throughput.
+_SQLITE_BULK_PRAGMAS: Dict[str, Any] = {
+    'synchronous': 'OFF',
+    'journal_mode': 'MEMORY',
+    'temp_store': 'MEMORY',
+    'cache_size': -200000
+}
+
+# SQLite triggers that copy each inserted city into a derived search table,
+# with the statement that brings that table up to date in one pass instead
+_SQLITE_DERIVED_TABLE_TRIGGERS: Dict[str, str] = {
+    'city_fts_insert': "INSERT INTO city_fts(city_fts) VALUES('rebuild')",
+    # Every row is rewritten, as upserted cities may have moved
+    'city_rtree_insert': (
+        "INSERT OR REPLACE INTO city_rtree "
+        "SELECT id, lat, lat, lng, lng FROM city_data"
+    )
+}
+
+# Attempts made at downloading the city data, and the delay in seconds before
+# the first retry (doubled for each further retry)
+_DOWNLOAD_ATTEMPTS = 3
+_DOWNLOAD_BACKOFF = 0.5
+
+# Lowercased CSV column names and the city_data column each one maps to,
+# covering the naming conventions of the supported datasets
+_COLUMN_MAP: Mapping[str, str] = MappingProxyType({
+    # Original dataset naming
+    'id': 'id',
+    'name': 'name',
+    'state_id': 'state_id',
+    'state_code': 'state_code',
+    'state_name': 'state_name',
+    'country_id': 'country_id',
+    'country_code': 'country_code',
+    'country_name': 'country_name',
+    'latitude': 'lat',
+    'lat': 'lat',
+    'longitude': 'lng',
+    'lng': 'lng',
+    'wikidataid': 'wikidata_id',
+    'wikidata_id': 'wikidata_id',
+    'population': 'population',
+    'timezone': 'timezone',
+    'city_id': 'id',
+    'city_name': 'name',
+    'timezone_id': 'timezone',
+    'iso2': 'country_code'
+})
+
+# Columns without which no row of a chunk can be imported
+_REQUIRED_COLUMNS: Tuple[str, ...] = ('id', 'name', 'country_code', 'lat', 'lng')
+
+# Number of leading bytes sampled to detect the CSV encoding
+_ENCODING_SAMPLE_BYTES = 64 * 1024
+
+# Minimum number of rows converted to a DataFrame at a time; chunks are split
+# into insert batches later, so small batch sizes do not mean small chunks
+_CSV_CHUNK_ROWS = 20000
+
+# Number of parsed chunks buffered ahead of the inserting thread
+_PREFETCH_CHUNKS = 2
+
+# Marks the end of the chunks handed over by the prefetch thread
+_END_OF_CHUNKS = object()
+
+# Minimum number of seconds between import progress log lines
+_PROGRESS_LOG_INTERVAL = 1.0
+
+# Marks NULL fields in the CSV streamed to PostgreSQL COPY, so unquoted empty
+# fields are read back as empty strings rather than NULL
+_COPY_NULL = '\\N'
+
+# Files larger than this (roughly 10k rows) are bulk loaded with secondary
+# indexes dropped and rebuilt afterwards in a single sorted pass
+_BULK_IMPORT_MIN_BYTES = 1 << 20
+
+# Explicit column types for the Arrow CSV reader. Code columns are kept as strings
+# so values like "NA" (Namibia) or "01" are not coerced to nulls or integers.
+# The streaming reader infers untyped columns from the first block only, so
+# every column a city CSV may carry is listed; absent ones are ignored.
+if USING_PYARROW:
+    _ARROW_COLUMN_TYPES = {
+        'id': pa.int64(),
+        'name': pa.string(),
+        'state_id': pa.int32(),
+        'state_code': pa.string(),
+        'state_name': pa.string(),
+        'country_id': pa.int32(),
+        'country_code': pa.string(),
+        'country_name': pa.string(),
+        'latitude': pa.float64(),
+        'longitude': pa.float64(),
+        'lat': pa.float64(),
+        'lng': pa.float64(),
+        'wikiDataId': pa.string(),
+        'wikidata_id': pa.string(),
+        'ascii_name': pa.string(),
+        'population': pa.float64(),
+        'timezone': pa.string(),
+    }
+    
+    # Arrow types matching the PostgreSQL city_data columns, which binary COPY
+    # requires exactly (INTEGER is 32 bits, the id included)
+    _ARROW_IMPORT_SCHEMA = pa.schema([
+        (col, pa.int32() if col in ('id', 'state_id', 'country_id', 'population')
+         else pa.float64() if col in ('lat', 'lng')
+         else pa.string())
+        for col in IMPORT_COLUMNS
+    ])
+
+def _resolve_package_base_dir() -> str:
+    """
+    Resolve the base directory where the GeoDash package is installed.
+    
+    Returns:
+        Path to the package base directory
+    """
+    if hasattr(sys, 'frozen'):
+        # For PyInstaller
+        return os.path.dirname(sys.executable)
+    try:
+        # For regular Python
+        return os.path.dirname(os.path.abspath(sys.modules['GeoDash'].__file__))
+    except (KeyError, AttributeError, TypeError):
+        # Module not found, use directory of this file
+        return os.path.dirname(os.path.abspath(__file__))
+
+# The install location does not change at runtime, so resolve it once at import
+_PACKAGE_BASE_DIR = _resolve_package_base_dir()
+_PACKAGE_CSV_PATH = Path(_PACKAGE_BASE_DIR, 'cities.csv')
+
 def get_data_directory() -> str:
     """
     Get the directory where GeoDash data is stored.
@@ -32,11 +224,26 @@ def get_data_directory() -> str:
     Returns:
         Path to the data directory (will be created if it doesn't exist)
     """
+    return _resolve_data_directory(os.environ.get('GEODASH_DATA_DIR'))
+
+@functools.lru_cache(maxsize=None)
+def _resolve_data_directory(env_data_dir: Optional[str]) -> str:
+    """
+    Resolve and create the data directory for a GEODASH_DATA_DIR value.
+    
+    Results are cached per environment value, so the filesystem is only
+    checked the first time each value is seen in a process.
+    
+    Args:
+        env_data_dir: Value of the GEODASH_DATA_DIR environment variable, if set
+        
+    Returns:
+        Path to the data directory
+    """
     # 1. Check environment variable first
-    if 'GEODASH_DATA_DIR' in os.environ:
-        data_dir = os.environ['GEODASH_DATA_DIR']
-        os.makedirs(data_dir, exist_ok=True)
-        return data_dir
+    if env_data_dir is not None:
+        os.makedirs(env_data_dir, exist_ok=True)
+        return env_data_dir
     
     # 2. Check ~/.geodash/data
     home_data_dir = os.path.join(os.path.expanduser('~'), '.geodash', 'data')
@@ -44,22 +251,124 @@ def get_data_directory() -> str:
         return home_data_dir
         
     # 3. Fall back to package directory
-    # Get the base directory where the module is installed
-    if hasattr(sys, 'frozen'):
-        # For PyInstaller
-        base_dir = os.path.dirname(sys.executable)
-    else:
-        try:
-            # For regular Python
-            base_dir = os.path.dirname(os.path.abspath(sys.modules['GeoDash'].__file__))
-        except (KeyError, AttributeError):
-            # Module not found, use directory of this file
-            base_dir = os.path.dirname(os.path.abspath(__file__))
-    
-    package_data_dir = os.path.join(base_dir, 'data')
+    package_data_dir = os.path.join(_PACKAGE_BASE_DIR, 'data')
     os.makedirs(package_data_dir, exist_ok=True)
     return package_data_dir
 
+def _to_ascii(name: str) -> str:
+    """
+    Transliterate a name to ASCII by stripping accents.
+    
+    Args:
+        name: Name to transliterate
+        
+    Returns:
+        ASCII form of the name, e.g. "Sao Paulo" for "São Paulo"
+    """
+    return unicodedata.normalize('NFKD', name).encode('ascii', 'ignore').decode('ascii')
+
+def _to_copy_csv(values: List[Tuple[Any, ...]]) -> io.StringIO:
+    """
+    Write rows as CSV for PostgreSQL COPY.
+    
+    Args:
+        values: City rows in IMPORT_COLUMNS order
+        
+    Returns:
+        The CSV text positioned at the start, with None and NaN written as
+        _COPY_NULL
+    """
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(
+        [_COPY_NULL if value is None or value != value else value for value in row]
+        for row in values
+    )
+    buffer.seek(0)
+    return buffer
+
+def _detect_encoding(csv_path: str) -> str:
+    """
+    Detect the text encoding of a CSV file from a sample of its first bytes.
+    
+    UTF-8 is confirmed with a plain decode so the common case stays cheap;
+    charset-normalizer is only consulted for files that are not UTF-8.
+    
+    Args:
+        csv_path: Path to the CSV file
+        
+    Returns:
+        Name of the detected encoding
+    """
+    with open(csv_path, 'rb') as f:
+        sample = f.read(_ENCODING_SAMPLE_BYTES)
+    
+    try:
+        sample.decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError as e:
+        # A multi-byte character cut off by the end of the sample is still UTF-8
+        if e.reason == 'unexpected end of data':
+            return 'utf-8'
+    
+    if USING_CHARSET_NORMALIZER:
+        best = charset_from_bytes(sample).best()
+        if best is not None:
+            return best.encoding
+    else:
+        logger.warning(f"{csv_path} is not UTF-8 and charset-normalizer is not installed, assuming ISO-8859-1")
+    
+    # Every byte sequence is valid ISO-8859-1, so it is the last resort
+    return 'iso-8859-1'
+
+def _file_sha256(path: str) -> Optional[str]:
+    """
+    Compute the SHA-256 digest of a file.
+    
+    Args:
+        path: Path to the file
+        
+    Returns:
+        Hex digest of the file contents, or None if the file does not exist
+    """
+    if not os.path.isfile(path):
+        return None
+    
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _read_download_metadata(csv_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Read the HTTP caching metadata stored next to a downloaded CSV file.
+    
+    Args:
+        csv_path: Path to the downloaded CSV file
+        
+    Returns:
+        Metadata dictionary, or None if missing or unreadable
+    """
+    try:
+        with open(csv_path + '.etag', 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _write_download_metadata(csv_path: str, metadata: Dict[str, Any]) -> None:
+    """
+    Store the HTTP caching metadata for a downloaded CSV file.
+    
+    Args:
+        csv_path: Path to the downloaded CSV file
+        metadata: Metadata to store (url, etag, last_modified, sha256)
+    """
+    try:
+        with open(csv_path + '.etag', 'w', encoding='utf-8') as f:
+            json.dump(metadata, f)
+    except OSError as e:
+        logger.warning(f"Could not write download metadata for {csv_path}: {e}")
+
 def download_city_data(force: bool = False, url: Optional[str] = None) -> str:
     """
     Download city data from the internet and save it to the data directory.
@@ -90,35 +399,220 @@ def download_city_data(force: bool = False, url: Optional[str] = None) -> str:
     if url is None:
         url = "https://raw.githubusercontent.com/dr5hn/countries-states-cities-database/refs/heads/master/csv/cities.csv"
     
+    tmp_path = csv_path + '.part'
+    logger.info(f"Downloading cities.csv from {url} to {csv_path}...")
+    
+    # Transient network failures are retried with exponential backoff; each
+    # retry resumes from the partial file where the server allows it
+    for attempt in range(_DOWNLOAD_ATTEMPTS):
+        try:
+            _fetch_city_data(url, csv_path)
+            return csv_path
+        except Exception as e:
+            if _is_transient_download_error(e) and attempt + 1 < _DOWNLOAD_ATTEMPTS:
+                delay = _DOWNLOAD_BACKOFF * (2 ** attempt)
+                logger.warning(f"Download attempt {attempt + 1} failed ({str(e)}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+            
+            # Keep a partial file that a later call can resume; discard the rest
+            resumable = not isinstance(e, urllib.error.HTTPError) and os.path.exists(tmp_path + '.etag')
+            if not resumable:
+                for path in (tmp_path, tmp_path + '.etag'):
+                    if os.path.exists(path):
+                        os.remove(path)
+            logger.error(f"Failed to download cities.csv: {e}")
+            raise DataImportError(
+                message=f"Technical error downloading cities.csv: {str(e)}",
+                user_message="Failed to download necessary data. Please check your internet connection.",
+                context={"url": url, "destination": str(csv_path)},
+                cause=e
+            )
+    
+    return csv_path
+
+def _is_transient_download_error(error: Exception) -> bool:
+    """
+    Check whether a failed download attempt is worth retrying.
+    
+    Timeouts, dropped or truncated connections and 5xx responses are
+    retried. Anything else, such as a DNS lookup failure when offline,
+    a refused connection or a 4xx response, fails at once.
+    
+    Args:
+        error: Exception raised by the download attempt
+        
+    Returns:
+        True if the download should be retried
+    """
+    if isinstance(error, urllib.error.HTTPError):
+        return error.code >= 500
+    if isinstance(error, urllib.error.URLError):
+        # urlopen wraps errors raised while connecting in URLError
+        error = error.reason if isinstance(error.reason, Exception) else error
+    if isinstance(error, socket.gaierror):
+        return False
+    return isinstance(error, (
+        socket.timeout, TimeoutError, ConnectionResetError, ConnectionAbortedError,
+        http.client.IncompleteRead, EOFError
+    ))
+
+def _fetch_city_data(url: str, csv_path: str) -> None:
+    """
+    Make one attempt at downloading the city data CSV to csv_path.
+    
+    The file is streamed into a '.part' file next to the destination and moved
+    into place once complete, so an interrupted transfer never replaces a
+    good copy.
+    
+    Args:
+        url: URL to download from
+        csv_path: Destination path of the CSV file
+        
+    Raises:
+        urllib.error.URLError: If the request fails
+        OSError: If the transfer is interrupted or the file cannot be written
+    """
+    # The CSV compresses well, so let the server send it gzip-encoded, and
+    # ask it to skip the transfer entirely if our copy is still current
+    headers = {'Accept-Encoding': 'gzip'}
+    metadata = _read_download_metadata(csv_path)
+    if metadata and metadata.get('url') == url and metadata.get('sha256') == _file_sha256(csv_path):
+        if metadata.get('etag'):
+            headers['If-None-Match'] = metadata['etag']
+        if metadata.get('last_modified'):
+            headers['If-Modified-Since'] = metadata['last_modified']
+    
+    # Resume an interrupted download if the server can confirm that the
+    # partial file is still the same resource; ranges only apply unencoded
+    tmp_path = csv_path + '.part'
+    partial = _read_download_metadata(tmp_path)
+    if partial and partial.get('url') == url and os.path.exists(tmp_path):
+        validator = partial.get('etag') or partial.get('last_modified')
+        if validator:
+            headers['Accept-Encoding'] = 'identity'
+            headers['Range'] = f"bytes={os.path.getsize(tmp_path)}-"
+            headers['If-Range'] = validator
+    
+    request = urllib.request.Request(url, headers=headers)
     try:
-        logger.info(f"Downloading cities.csv from {url} to {csv_path}...")
-        urllib.request.urlretrieve(url, csv_path)
-        logger.info("Download complete!")
-        return csv_path
-    except Exception as e:
-        logger.error(f"Failed to download cities.csv: {e}")
-        raise DataImportError(
-            message=f"Technical error downloading cities.csv: {str(e)}",
-            user_message="Failed to download necessary data. Please check your internet connection.",
-            context={"url": url, "destination": str(csv_path)},
-            cause=e
-        )
+        with urllib.request.urlopen(request) as response:
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            gzipped = response.headers.get('Content-Encoding', '').lower() == 'gzip'
+            resumed = response.getcode() == 206
+            
+            if resumed:
+                logger.info(f"Resuming download at byte {os.path.getsize(tmp_path)}")
+            elif not gzipped:
+                _write_download_metadata(tmp_path, {
+                    'url': url,
+                    'etag': etag,
+                    'last_modified': last_modified
+                })
+            
+            with open(tmp_path, 'ab' if resumed else 'wb') as f:
+                start = f.tell()
+                source = gzip.GzipFile(fileobj=response) if gzipped else response
+                shutil.copyfileobj(source, f, length=1 << 20)
+                received = f.tell() - start
+            
+            # A connection dropped mid-body reads as a short, clean end of
+            # file, so check the length rather than keep a truncated file
+            expected = response.headers.get('Content-Length')
+            if not gzipped and expected is not None and received < int(expected):
+                raise http.client.IncompleteRead(b'', int(expected) - received)
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            logger.info(f"Cities data at {csv_path} is up to date")
+            return
+        raise
+    
+    os.replace(tmp_path, csv_path)
+    if os.path.exists(tmp_path + '.etag'):
+        os.remove(tmp_path + '.etag')
+    _write_download_metadata(csv_path, {
+        'url': url,
+        'etag': etag,
+        'last_modified': last_modified,
+        'sha256': _file_sha256(csv_path)
+    })
+    logger.info("Download complete!")
 
 class CityDataImporter:
     """
     A class to import city data from various sources into the GeoDash database.
     """
     
-    def __init__(self, db_manager: DatabaseManager) -> None:
+    def __init__(self, db_manager: DatabaseManager, max_workers: int = 4) -> None:
         """
         Initialize the CityDataImporter.
         
         Args:
             db_manager: The database manager to use for import operations
+            max_workers: Maximum number of threads inserting batches concurrently.
+                Only used for pooled PostgreSQL connections; SQLite always
+                imports from a single writer.
         """
         self.db_manager = db_manager
+        self.max_workers = max_workers
+        
+        # Connection holding the import-wide SQLite transaction, if any
+        self._bulk_connection = None
+        
+        # Definitions of custom PostgreSQL indexes dropped for a bulk load
+        self._dropped_index_defs: List[str] = []
+        
+        # Names and definitions of SQLite triggers dropped for a bulk load
+        self._dropped_trigger_defs: List[Tuple[str, str]] = []
+        
+        # Rows dropped by validation during the current import
+        self._skipped_rows = 0
+        
+        # Country name to ISO code pairs seen in imported data
+        self._country_codes: Dict[str, str] = {}
+        
+        # ADBC connections of the current import, one per inserting thread.
+        # After the first failed ingest the remaining chunks go straight to COPY.
+        self._adbc_local = threading.local()
+        self._adbc_connections: List[Any] = []
+        self._adbc_lock = threading.Lock()
+        self._adbc_disabled = False
+        
+        # The INSERT statements only depend on the column list, so build them
+        # once. Rows whose ID already exists are updated in place, so
+        # re-importing an updated CSV refreshes them.
+        column_list = ", ".join(IMPORT_COLUMNS)
+        upsert_clause = "ON CONFLICT (id) DO UPDATE SET " + ", ".join(
+            f"{col} = excluded.{col}" for col in IMPORT_COLUMNS if col != 'id'
+        )
+        self._sqlite_insert_sql = (
+            f"INSERT INTO city_data ({column_list}) "
+            f"VALUES ({', '.join(['?'] * len(IMPORT_COLUMNS))}) {upsert_clause}"
+        )
+        self._pg_insert_sql = (
+            f"INSERT INTO city_data ({column_list}) VALUES %s {upsert_clause}"
+        )
+        self._pg_insert_template = f"({', '.join(['%s'] * len(IMPORT_COLUMNS))})"
+        self._pg_copy_sql = (
+            f"COPY city_data ({column_list}) FROM STDIN WITH (FORMAT csv, NULL '{_COPY_NULL}')"
+        )
+        
+        # Batches that conflict with existing rows are copied into a session
+        # temporary table and merged with a single INSERT ... SELECT
+        self._pg_staging_sql = (
+            "CREATE TEMP TABLE IF NOT EXISTS city_data_staging "
+            "(LIKE city_data INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+        )
+        self._pg_staging_copy_sql = (
+            f"COPY city_data_staging ({column_list}) FROM STDIN WITH (FORMAT csv, NULL '{_COPY_NULL}')"
+        )
+        self._pg_merge_sql = (
+            f"INSERT INTO city_data ({column_list}) "
+            f"SELECT {column_list} FROM city_data_staging {upsert_clause}"
+        )
     
-    def import_from_csv(self, csv_path: Optional[str] = None, batch_size: int = 1000, download_if_missing: bool = True) -> int:
+    def import_from_csv(self, csv_path: Optional[str] = None, batch_size: Optional[int] = None, download_if_missing: bool = True) -> int:
         """
         Import city data from a CSV file.
         
@@ -126,6 +620,8 @@ class CityDataImporter:
             csv_path: Path to the CSV file to import.
                 If None, attempts to find a default file.
             batch_size: Number of records to import at once.
+                If None, uses the database's recommended batch size
+                (1000 for PostgreSQL, 10000 for SQLite).
             download_if_missing: Whether to download the CSV file if not found.
             
         Returns:
@@ -137,6 +633,12 @@ class CityDataImporter:
         """
         start_time = time.time()
         
+        if batch_size is None:
+            batch_size = self.db_manager.recommended_batch_size
+        self._skipped_rows = 0
+        self._adbc_local = threading.local()
+        self._adbc_disabled = False
+        
         if csv_path is None:
             # Try to find the CSV file
             csv_path = self._find_csv_file()
@@ -155,7 +657,7 @@ class CityDataImporter:
                 )
         
         # Ensure the CSV file exists
-        if not os.path.exists(csv_path):
+        if not os.path.isfile(csv_path):
             if download_if_missing:
                 logger.warning(f"CSV file not found at {csv_path}. Downloading...")
                 csv_path = download_city_data(force=True)
@@ -170,35 +672,88 @@ class CityDataImporter:
         
         # Read the CSV file
         try:
-            # Use pandas to read the CSV file
-            logger.info("Reading CSV file...")
-            
-            # Load in chunks to save memory for large files
-            chunk_reader = pd.read_csv(
-                csv_path, 
-                chunksize=batch_size,
-                encoding='utf-8',
-                low_memory=False
-            )
+            cache_path = os.path.splitext(csv_path)[0] + '.feather'
+            cache_source = None
+            chunk_rows = max(batch_size, _CSV_CHUNK_ROWS)
             
-            total_imported = 0
-            for i, chunk in enumerate(chunk_reader):
-                # Clean up the dataframe
-                df = self._standardize_columns(chunk)
+            # The cache is keyed on the source contents, not its mtime
+            if USING_PYARROW:
+                cache_source = {
+                    'source_size': str(os.path.getsize(csv_path)),
+                    'source_sha256': _file_sha256(csv_path)
+                }
+            
+            if self._is_cache_fresh(cache_path, cache_source):
+                # Reuse the columnar copy written by a previous import
+                logger.info(f"Reading standardized city data from {cache_path}")
+                chunk_reader = self._read_feather_cache(cache_path, chunk_rows)
+            else:
+                logger.info("Reading CSV file...")
                 
-                # Import the chunk
-                n_imported = self._import_dataframe(df, batch_size)
-                total_imported += n_imported
+                encoding = _detect_encoding(csv_path)
+                if encoding != 'utf-8':
+                    logger.info(f"Reading CSV file as {encoding}")
                 
-                logger.info(f"Imported chunk {i+1} with {n_imported} cities. Total: {total_imported}")
+                if USING_PYARROW:
+                    # Multithreaded Arrow parser, much faster than pandas' C engine
+                    raw_reader = self._read_csv_arrow(csv_path, chunk_rows, encoding)
+                else:
+                    # Stream in chunks to save memory for large files; only
+                    # empty fields are missing, so Namibia's 'NA' survives.
+                    raw_reader = pd.read_csv(
+                        csv_path, 
+                        chunksize=chunk_rows,
+                        encoding=encoding,
+                        keep_default_na=False,
+                        na_values=[''],
+                        low_memory=False
+                    )
+                chunk_reader = self._standardize_chunks(
+                    raw_reader, cache_path if cache_source else None, cache_source
+                )
+            
+            # Maintaining indexes row by row is much slower than building them once
+            bulk_load = os.path.getsize(csv_path) >= _BULK_IMPORT_MIN_BYTES
+            if bulk_load:
+                self._disable_indexes()
+            
+            # SQLite imports run as one transaction on one connection
+            if self.db_manager.db_type == 'sqlite':
+                bulk_session = self._sqlite_bulk_session()
+            else:
+                bulk_session = nullcontext()
+            
+            try:
+                with bulk_session:
+                    workers = self._get_import_workers()
+                    if workers > 1:
+                        total_imported = self._import_chunks_parallel(chunk_reader, batch_size, workers)
+                    else:
+                        total_imported = 0
+                        last_log = time.monotonic()
+                        for i, df in enumerate(self._prefetch_chunks(chunk_reader)):
+                            # Import the chunk
+                            n_imported = self._import_dataframe(df, batch_size)
+                            total_imported += n_imported
+                            
+                            # Release the chunk before the next one is fetched
+                            del df
+                            
+                            now = time.monotonic()
+                            if now - last_log >= _PROGRESS_LOG_INTERVAL and logger.isEnabledFor(logging.INFO):
+                                logger.info(f"Imported chunk {i+1} with {n_imported} cities. Total: {total_imported}")
+                                last_log = now
+            finally:
+                self._close_adbc_connections()
+                if bulk_load:
+                    self._rebuild_indexes()
+            
+            if self._skipped_rows:
+                logger.info(f"Skipped {self._skipped_rows} invalid rows")
             
             elapsed = time.time() - start_time
             logger.info(f"Successfully imported {total_imported} cities in {elapsed:.2f} seconds")
             
-            # Update geometry column if using PostGIS
-            if self.db_manager.db_type == 'postgresql':
-                self._update_postgis_geometry()
-            
             return total_imported
             
         except Exception as e:
@@ -211,39 +766,412 @@ class CityDataImporter:
                 cause=e
             )
     
-    def _find_csv_file(self) -> Optional[str]:
+    @contextmanager
+    def _sqlite_bulk_session(self) -> Iterator[Any]:
         """
-        Find a city data CSV file in common locations.
+        Run a SQLite import inside a single transaction with fast-load pragmas.
+        
+        The previous pragma values are restored when the session ends, and the
+        transaction is rolled back if the import fails.
+        
+        Yields:
+            The SQLite connection used for the import
+        """
+        with self.db_manager.raw_connection() as connection:
+            saved_pragmas = {
+                pragma: connection.execute(f"PRAGMA {pragma}").fetchone()[0]
+                for pragma in _SQLITE_BULK_PRAGMAS
+            }
+            
+            try:
+                for pragma, value in _SQLITE_BULK_PRAGMAS.items():
+                    connection.execute(f"PRAGMA {pragma} = {value}")
+                
+                # Take the write lock up front so the import cannot fail midway on SQLITE_BUSY
+                connection.execute("BEGIN IMMEDIATE")
+                self._bulk_connection = connection
+                try:
+                    yield connection
+                    connection.commit()
+                except Exception:
+                    connection.rollback()
+                    raise
+            finally:
+                self._bulk_connection = None
+                for pragma, value in saved_pragmas.items():
+                    connection.execute(f"PRAGMA {pragma} = {value}")
+    
+    def _disable_indexes(self) -> None:
+        """
+        Drop the secondary indexes on the city_data table before a bulk load.
+        
+        Keeping an index only slows the load down, so errors are logged and the
+        import carries on. Only the indexes and triggers actually dropped are
+        recorded for _rebuild_indexes to restore.
+        """
+        self._dropped_index_defs = []
+        self._dropped_trigger_defs = []
+        try:
+            with self.db_manager.cursor() as cursor:
+                for index in CITY_INDEXES:
+                    cursor.execute(f"DROP INDEX IF EXISTS {index['name']}")
+                
+                # The PostGIS and full-text indexes would otherwise be updated
+                # for every loaded row; remember their definitions to restore them
+                if self.db_manager.db_type == 'postgresql':
+                    cursor.execute(
+                        "SELECT indexdef FROM pg_indexes WHERE tablename = 'city_data' AND indexname = ANY(%s)",
+                        (list(POSTGRESQL_CUSTOM_INDEXES),)
+                    )
+                    index_defs = [
+                        row['indexdef'] if isinstance(row, dict) else row[0]
+                        for row in cursor.fetchall()
+                    ]
+                    for index_name in POSTGRESQL_CUSTOM_INDEXES:
+                        cursor.execute(f"DROP INDEX IF EXISTS {index_name}")
+                
+                # Likewise the FTS and R*Tree tables are filled by per-row
+                # triggers, which dominate SQLite load time. SQLite commits each
+                # DROP on its own, so every trigger is recorded once dropped.
+                elif self.db_manager.db_type == 'sqlite':
+                    names = list(_SQLITE_DERIVED_TABLE_TRIGGERS)
+                    cursor.execute(
+                        "SELECT name, sql FROM sqlite_master WHERE type = 'trigger' "
+                        f"AND tbl_name = 'city_data' AND name IN ({', '.join(['?'] * len(names))})",
+                        names
+                    )
+                    for trigger_name, trigger_def in [(row[0], row[1]) for row in cursor.fetchall()]:
+                        cursor.execute(f"DROP TRIGGER IF EXISTS {trigger_name}")
+                        self._dropped_trigger_defs.append((trigger_name, trigger_def))
+            
+            # PostgreSQL drops the indexes together, once the transaction commits
+            if self.db_manager.db_type == 'postgresql':
+                self._dropped_index_defs = index_defs
+            logger.info("Dropped secondary indexes for bulk import")
+        except Exception as e:
+            logger.warning(f"Error dropping indexes before import: {str(e)}")
+    
+    def _rebuild_indexes(self) -> None:
+        """
+        Recreate the secondary indexes on the city_data table after a bulk load
+        and refresh the query planner statistics.
+        
+        The dropped triggers are restored first, each on its own, so later
+        writes keep the derived tables in sync even if a rebuild fails.
+        
+        Raises:
+            Exception: If a trigger, index or derived table could not be rebuilt
+        """
+        trigger_defs, self._dropped_trigger_defs = self._dropped_trigger_defs, []
+        index_defs, self._dropped_index_defs = self._dropped_index_defs, []
+        
+        error = None
+        for trigger_name, trigger_def in trigger_defs:
+            try:
+                with self.db_manager.cursor() as cursor:
+                    cursor.execute(trigger_def)
+            except Exception as e:
+                logger.error(f"Error restoring trigger {trigger_name} after import: {str(e)}")
+                error = error or e
+        
+        try:
+            for index in CITY_INDEXES:
+                self.db_manager.create_index(
+                    index_name=index['name'],
+                    table_name='city_data',
+                    columns=index['columns']
+                )
+            
+            with self.db_manager.cursor() as cursor:
+                for index_def in index_defs:
+                    cursor.execute(index_def)
+                
+                # Catch the derived tables up with a single pass each
+                for trigger_name, _ in trigger_defs:
+                    cursor.execute(_SQLITE_DERIVED_TABLE_TRIGGERS[trigger_name])
+                cursor.execute("ANALYZE city_data")
+        except Exception as e:
+            logger.error(f"Error rebuilding indexes after import: {str(e)}")
+            error = error or e
+        
+        if error is not None:
+            raise error
+        logger.info("Rebuilt secondary indexes after bulk import")
+    
+    def _get_import_workers(self) -> int:
+        """
+        Get the number of threads to use for inserting batches.
+        
+        Concurrent inserts only help when every thread gets its own connection,
+        which is the case for pooled PostgreSQL connections. SQLite allows a
+        single writer, so it always imports sequentially.
         
         Returns:
-            Path to the CSV file if found, None otherwise
+            Number of worker threads (1 means sequential import)
         """
-        # Check in the data directory
-        data_dir = get_data_directory()
-        csv_path = os.path.join(data_dir, 'cities.csv')
-        if os.path.exists(csv_path):
-            return csv_path
+        pool = self.db_manager.connection_pool
+        if self.db_manager.db_type != 'postgresql' or pool is None:
+            return 1
+        return max(1, min(self.max_workers, pool.max_connections))
+    
+    def _import_chunks_parallel(self, chunk_reader: Iterator[pd.DataFrame], batch_size: int, workers: int) -> int:
+        """
+        Import standardized chunks using a pool of threads, one database connection each.
         
-        # Check in the current directory
-        csv_path = os.path.join(os.getcwd(), 'cities.csv')
-        if os.path.exists(csv_path):
-            return csv_path
+        At most two chunks per worker are in flight at any time so parsed
+        chunks do not pile up in memory while the database catches up.
         
-        # Check in the package directory
-        if hasattr(sys, 'frozen'):
-            # For PyInstaller
-            base_dir = os.path.dirname(sys.executable)
-        else:
+        Args:
+            chunk_reader: Iterator over standardized DataFrame chunks
+            batch_size: Number of records to import at once
+            workers: Number of worker threads
+            
+        Returns:
+            Number of cities imported
+        """
+        total_imported = 0
+        completed = 0
+        pending = set()
+        last_log = time.monotonic()
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for df in chunk_reader:
+                pending.add(executor.submit(self._import_dataframe, df, batch_size))
+                
+                if len(pending) >= workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        total_imported += future.result()
+                        completed += 1
+                    
+                    now = time.monotonic()
+                    if now - last_log >= _PROGRESS_LOG_INTERVAL and logger.isEnabledFor(logging.INFO):
+                        logger.info(f"Imported {completed} chunks. Total: {total_imported}")
+                        last_log = now
+            
+            for future in pending:
+                total_imported += future.result()
+        
+        return total_imported
+    
+    def _prefetch_chunks(self, chunk_reader: Iterator[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """
+        Read chunks on a background thread so parsing overlaps with inserts.
+        
+        At most _PREFETCH_CHUNKS parsed chunks wait in the queue, which bounds
+        memory when parsing outpaces the database. Errors raised while reading
+        are re-raised in the consuming thread.
+        
+        Args:
+            chunk_reader: Iterator over standardized DataFrame chunks
+            
+        Returns:
+            Iterator over the same chunks, in order
+        """
+        chunks = queue.Queue(maxsize=_PREFETCH_CHUNKS)
+        stop = threading.Event()
+        
+        def put(item: Any) -> bool:
+            # Give up if the consumer has gone away instead of blocking forever
+            while not stop.is_set():
+                try:
+                    chunks.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def produce() -> None:
             try:
-                # For regular Python
-                base_dir = os.path.dirname(os.path.abspath(sys.modules['GeoDash'].__file__))
-            except (KeyError, AttributeError):
-                # Module not found, use directory of this file
-                base_dir = os.path.dirname(os.path.abspath(__file__))
-        
-        csv_path = os.path.join(base_dir, 'cities.csv')
-        if os.path.exists(csv_path):
-            return csv_path
+                for df in chunk_reader:
+                    if not put(df):
+                        return
+                    del df
+            except Exception as e:
+                put(e)
+                return
+            put(_END_OF_CHUNKS)
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(produce)
+            try:
+                while True:
+                    item = chunks.get()
+                    if item is _END_OF_CHUNKS:
+                        break
+                    if isinstance(item, Exception):
+                        raise item
+                    yield item
+            finally:
+                stop.set()
+    
+    def _standardize_chunks(self, raw_reader: Iterator[pd.DataFrame],
+                            cache_path: Optional[str] = None,
+                            cache_source: Optional[Dict[str, str]] = None) -> Iterator[pd.DataFrame]:
+        """
+        Standardize raw CSV chunks as they are read.
+        
+        When a cache path is given, each standardized chunk is also appended
+        to a Feather file as it passes through, so the cache never needs more
+        than one chunk in memory. The file is only moved into place once the
+        whole CSV has been read.
+        
+        Args:
+            raw_reader: Iterator over raw CSV chunks
+            cache_path: Optional path of the Feather cache to write
+            cache_source: Size and digest of the source CSV, stored in the cache
+            
+        Returns:
+            Iterator over standardized DataFrame chunks
+        """
+        writer = None
+        tmp_path = f"{cache_path}.part" if cache_path else None
+        complete = False
+        try:
+            for chunk in raw_reader:
+                df = self._standardize_columns(chunk)
+                # Neither the raw chunk nor, once handed over, the standardized
+                # one is kept alive while the next chunk is parsed
+                del chunk
+                if tmp_path is not None:
+                    writer = self._append_to_cache(writer, tmp_path, df, cache_source)
+                    if writer is None:
+                        tmp_path = None
+                yield df
+                del df
+            complete = True
+        finally:
+            if writer is not None:
+                writer.close()
+            if tmp_path is not None:
+                if complete and writer is not None:
+                    os.replace(tmp_path, cache_path)
+                    logger.info(f"Cached standardized city data at {cache_path}")
+                elif os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+    
+    def _append_to_cache(self, writer: Optional[Any], tmp_path: str, df: pd.DataFrame,
+                         cache_source: Optional[Dict[str, str]]) -> Optional[Any]:
+        """
+        Append a standardized chunk to the Feather cache being written.
+        
+        Args:
+            writer: Open IPC file writer, or None to create one
+            tmp_path: Path of the cache file being written
+            df: Standardized DataFrame chunk
+            cache_source: Size and digest of the source CSV, stored in the cache
+            
+        Returns:
+            The writer to use for the next chunk, or None if writing failed
+            and the cache should be abandoned
+        """
+        try:
+            if writer is None:
+                schema = _ARROW_IMPORT_SCHEMA.with_metadata(cache_source or {})
+                writer = pa.ipc.new_file(tmp_path, schema)
+            writer.write_table(pa.Table.from_pandas(df, schema=_ARROW_IMPORT_SCHEMA, preserve_index=False))
+            return writer
+        except Exception as e:
+            logger.warning(f"Could not write city data cache {tmp_path}: {str(e)}")
+            if writer is not None:
+                writer.close()
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return None
+    
+    def _is_cache_fresh(self, cache_path: str, cache_source: Optional[Dict[str, str]]) -> bool:
+        """
+        Check whether the columnar cache of a CSV file can be used.
+        
+        Args:
+            cache_path: Path to the Feather cache file
+            cache_source: Size and digest of the source CSV
+            
+        Returns:
+            True if the cache exists, was written from a CSV file with the
+            same size and digest and has the current import columns
+        """
+        if not USING_PYARROW or not cache_source:
+            return False
+        try:
+            with pa.memory_map(cache_path) as source:
+                schema = pa.ipc.open_file(source).schema
+        except (OSError, pa.ArrowInvalid):
+            return False
+        
+        # A cache written by an older version may have different columns
+        metadata = {
+            key.decode('utf-8'): value.decode('utf-8')
+            for key, value in (schema.metadata or {}).items()
+        }
+        return (
+            schema.names == list(IMPORT_COLUMNS)
+            and all(metadata.get(key) == value for key, value in cache_source.items())
+        )
+    
+    def _read_feather_cache(self, cache_path: str, batch_size: int) -> Iterator[pd.DataFrame]:
+        """
+        Read standardized city data from a memory-mapped Feather file.
+        
+        Args:
+            cache_path: Path to the Feather cache file
+            batch_size: Maximum number of rows per yielded DataFrame
+            
+        Returns:
+            Iterator over standardized DataFrame chunks, typed as
+            _standardize_columns returns them
+        """
+        table = pa_feather.read_table(cache_path, memory_map=True)
+        for batch in table.to_batches(max_chunksize=batch_size):
+            # Nullable integers would otherwise come back as float64 with NaN
+            df = batch.to_pandas(types_mapper={pa.int32(): pd.Int32Dtype()}.get)
+            df['id'] = df['id'].astype('int64')
+            yield self._to_nullable_ints(df)
+    
+    def _read_csv_arrow(self, csv_path: str, batch_size: int, encoding: str = 'utf-8') -> Iterator[pd.DataFrame]:
+        """
+        Read a CSV file with the pyarrow streaming CSV reader.
+        
+        Args:
+            csv_path: Path to the CSV file to read
+            batch_size: Maximum number of rows per yielded DataFrame
+            encoding: Text encoding of the CSV file
+            
+        Returns:
+            Iterator over DataFrame chunks of at most batch_size rows
+        """
+        reader = pa_csv.open_csv(
+            csv_path,
+            read_options=pa_csv.ReadOptions(block_size=8 << 20, encoding=encoding),
+            convert_options=pa_csv.ConvertOptions(
+                column_types=_ARROW_COLUMN_TYPES,
+                strings_can_be_null=True,
+                null_values=['']
+            )
+        )
+        
+        # Stream blocks rather than parsing the whole file first, so only a
+        # block is held in Arrow memory at a time
+        for record_batch in reader:
+            for offset in range(0, record_batch.num_rows, batch_size):
+                yield record_batch.slice(offset, batch_size).to_pandas()
+    
+    def _find_csv_file(self) -> Optional[str]:
+        """
+        Find a city data CSV file in common locations.
+        
+        Returns:
+            Path to the CSV file if found, None otherwise
+        """
+        # Check the data directory, the current directory, then the package directory
+        candidates = (
+            Path(get_data_directory(), 'cities.csv'),
+            Path('cities.csv').absolute(),
+            _PACKAGE_CSV_PATH
+        )
+        for csv_path in candidates:
+            if csv_path.is_file():
+                return str(csv_path)
         
         return None
     
@@ -260,67 +1188,121 @@ class CityDataImporter:
         # Convert column names to lowercase
         df.columns = [col.lower() for col in df.columns]
         
-        # Handle different column naming conventions in CSV files
-        column_map = {
-            # Original dataset naming
-            'id': 'id',
-            'name': 'name',
-            'state_id': 'state_id',
-            'state_code': 'state_code',
-            'state_name': 'state_name',
-            'country_id': 'country_id',
-            'country_code': 'country_code',
-            'country_name': 'country_name',
-            'latitude': 'lat',
-            'lat': 'lat',
-            'longitude': 'lng',
-            'lng': 'lng',
-            'wikiDataId': 'wikidata_id',
-            'wikidata_id': 'wikidata_id',
-            'population': 'population',
-            'timezone': 'timezone',
-            'city_id': 'id',
-            'city_name': 'name',
-            'timezone_id': 'timezone',
-            'iso2': 'country_code'
-        }
+        # Rename columns based on the mapping in one pass; the first source
+        # found for a missing destination wins
+        rename_map: Dict[str, str] = {}
+        for src, dest in _COLUMN_MAP.items():
+            if (src != dest and src in df.columns and dest not in df.columns
+                    and dest not in rename_map.values()):
+                rename_map[src] = dest
+        if rename_map:
+            df = df.rename(columns=rename_map)
         
-        # Rename columns based on the mapping
-        for src, dest in column_map.items():
-            if src in df.columns and dest not in df.columns:
-                df[dest] = df[src]
+        # The repositories query the country and state names as 'country' and 'state'
+        if 'country_name' in df.columns:
+            if 'country' not in df.columns:
+                df['country'] = df['country_name']
+            self._fill_country_codes(df)
+        if 'state_name' in df.columns and 'state' not in df.columns:
+            df['state'] = df['state_name']
                 
-        # Ensure required columns exist
-        required_columns = ['id', 'name', 'country_code', 'lat', 'lng']
-        for col in required_columns:
-            if col not in df.columns:
-                logger.warning(f"Required column {col} missing from CSV")
-                # Add empty column
-                df[col] = None
+        # Without a required column every row would be filtered out below, so
+        # skip the work; optional columns are filled in by the final reindex
+        missing_columns = [col for col in _REQUIRED_COLUMNS if col not in df.columns]
+        if missing_columns:
+            logger.warning(f"Required columns missing from CSV: {', '.join(missing_columns)}")
+            return pd.DataFrame(columns=IMPORT_COLUMNS)
                 
-        # Ensure all columns have the right type
-        if 'id' in df.columns:
-            df['id'] = pd.to_numeric(df['id'], errors='coerce')
-        if 'lat' in df.columns:
-            df['lat'] = pd.to_numeric(df['lat'], errors='coerce')
-        if 'lng' in df.columns:
-            df['lng'] = pd.to_numeric(df['lng'], errors='coerce')
-        if 'population' in df.columns:
-            df['population'] = pd.to_numeric(df['population'], errors='coerce')
-            
-        # Filter out invalid coordinates
-        df = df[(df['lat'].notna()) & (df['lng'].notna())]
-        df = df[(df['lat'] >= -90) & (df['lat'] <= 90)]
-        df = df[(df['lng'] >= -180) & (df['lng'] <= 180)]
-        
-        # Filter out missing names
-        df = df[df['name'].notna()]
-        
-        # Filter out missing country codes
-        df = df[df['country_code'].notna()]
+        # Ensure all columns have the right type. The Arrow reader already
+        # yields typed columns, so only text columns are converted. Coordinates
+        # stay float64: float32 would alter stored values past the 5th decimal.
+        numeric_columns = [
+            col for col in ('id', 'lat', 'lng', 'population')
+            if col in df.columns and not pd.api.types.is_numeric_dtype(df[col])
+        ]
+        if numeric_columns:
+            df[numeric_columns] = df[numeric_columns].apply(pd.to_numeric, errors='coerce')
+            
+        # Filter out missing IDs, invalid coordinates, missing names and missing
+        # country codes with one mask over the raw arrays (NaN coordinates fail
+        # the range comparisons)
+        lat = df['lat'].to_numpy()
+        lng = df['lng'].to_numpy()
+        with np.errstate(invalid='ignore'):
+            valid = (
+                (lat >= -90) & (lat <= 90)
+                & (lng >= -180) & (lng <= 180)
+                & df['id'].notna().to_numpy()
+                & df['name'].notna().to_numpy()
+                & df['country_code'].notna().to_numpy()
+            )
+        skipped = len(valid) - int(np.count_nonzero(valid))
+        if skipped:
+            self._skipped_rows += skipped
+            df = df[valid]
+        
+        # Keep the last row for each ID, as the upsert would; PostgreSQL also
+        # rejects an upsert that touches the same row twice
+        df = df.drop_duplicates(subset='id', keep='last')
+        
+        # Transliterate each distinct name once; names repeat across states
+        if 'ascii_name' not in df.columns:
+            ascii_names = {name: _to_ascii(name) for name in df['name'].unique()}
+            df['ascii_name'] = df['name'].map(ascii_names)
+        
+        # Keep exactly the imported columns so every record has every key
+        df = df.reindex(columns=IMPORT_COLUMNS)
+        df['id'] = df['id'].astype('int64')
+        
+        return self._to_nullable_ints(df)
+    
+    def _to_nullable_ints(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert the nullable integer columns to Python ints and None in place.
         
+        The drivers are passed ints and None rather than floats and NaN, which
+        PostgreSQL rejects for INTEGER columns; all of these fit in int32.
+        
+        Args:
+            df: DataFrame with the IMPORT_COLUMNS columns
+            
+        Returns:
+            The same DataFrame
+        """
+        for col, dtype in _INTEGER_COLUMN_TYPES.items():
+            values = pd.to_numeric(df[col], errors='coerce').round().astype(dtype)
+            df[col] = values.astype(object).where(values.notna(), None)
         return df
     
+    def _fill_country_codes(self, df: pd.DataFrame) -> None:
+        """
+        Fill missing country codes in place from the country names.
+        
+        The name to code lookup is learned from rows that have both and kept
+        across chunks, so only the ~250 distinct countries are hashed
+        into it rather than every row. Codes are deliberately not derived
+        from the name itself (its first two letters would make Germany "GE",
+        which is Georgia); rows whose country never appears with a code keep
+        a missing code and are dropped by validation, as before.
+        
+        Args:
+            df: DataFrame with a country_name column
+        """
+        if 'country_code' not in df.columns:
+            df['country_code'] = None
+        
+        codes = df['country_code']
+        names = df['country_name']
+        
+        known = codes.notna() & names.notna()
+        if known.any():
+            pairs = df.loc[known, ['country_name', 'country_code']].drop_duplicates('country_name')
+            self._country_codes.update(zip(pairs['country_name'], pairs['country_code']))
+        
+        missing = codes.isna() & names.notna()
+        if missing.any():
+            df.loc[missing, 'country_code'] = names[missing].map(self._country_codes)
+    
     def _import_dataframe(self, df: pd.DataFrame, batch_size: int) -> int:
         """
         Import a DataFrame into the database.
@@ -332,29 +1314,102 @@ class CityDataImporter:
         Returns:
             Number of records imported
         """
-        # Convert DataFrame to list of dictionaries
-        cities = df.to_dict('records')
+        if (self.db_manager.db_type == 'postgresql' and USING_ADBC_POSTGRESQL
+                and not self._adbc_disabled and self._ingest_dataframe_adbc(df)):
+            return len(df)
         
-        # Split into batches
+        # Rows come out as plain tuples already in INSERT column order; the
+        # frame was validated by _standardize_columns. Converting whole columns
+        # with tolist() and zipping them is several times faster than itertuples.
+        # Only one batch of tuples is built at a time to bound memory.
         total_imported = 0
-        for i in range(0, len(cities), batch_size):
-            batch = cities[i:i+batch_size]
+        for i in range(0, len(df), batch_size):
+            # Chunks are usually no larger than a batch; use them unsliced
+            part = df if len(df) <= batch_size else df.iloc[i:i+batch_size]
+            batch = list(zip(*(part[col].tolist() for col in IMPORT_COLUMNS)))
+            total_imported += self._import_batch(batch)
             
-            # Filter invalid cities
-            valid_batch = self._filter_valid_cities(batch)
+        return total_imported
+    
+    def _ingest_dataframe_adbc(self, df: pd.DataFrame) -> bool:
+        """
+        Ingest a DataFrame into PostgreSQL through the ADBC driver.
+        
+        The whole chunk is sent as one Arrow table in its own transaction. COPY
+        cannot update conflicting rows, so on any failure nothing is written,
+        ADBC is disabled for the rest of the import and the caller falls back
+        to the DB-API import path.
+        
+        Args:
+            df: Standardized DataFrame with the IMPORT_COLUMNS columns
             
-            # Import the batch
-            n_imported = self._import_batch(valid_batch)
-            total_imported += n_imported
+        Returns:
+            True if the chunk was ingested, False if it should be retried
+        """
+        if df.empty:
+            return True
+        
+        conn = None
+        try:
+            table = pa.Table.from_pandas(df, schema=_ARROW_IMPORT_SCHEMA, preserve_index=False)
+            conn = self._get_adbc_connection()
+            with conn.cursor() as cursor:
+                cursor.adbc_ingest('city_data', table, mode='append')
+            conn.commit()
+            return True
+        except Exception as e:
+            self._adbc_disabled = True
+            logger.warning(f"ADBC ingest failed ({str(e)}), importing the remaining chunks with COPY")
+            if conn is not None:
+                try:
+                    conn.rollback()
+                except Exception:
+                    pass
+            return False
+    
+    def _get_adbc_connection(self) -> Any:
+        """
+        Get the calling thread's ADBC connection, opening it on first use.
+        
+        The connection is opened with the same timeout and libpq options as
+        the DatabaseManager's own connections.
+        
+        Returns:
+            ADBC DB-API connection
+        """
+        conn = getattr(self._adbc_local, 'connection', None)
+        if conn is None:
+            params = {'connect_timeout': str(self.db_manager.connection_timeout)}
+            params.update(self.db_manager.connection_options)
+            separator = '&' if '?' in self.db_manager.db_uri else '?'
+            uri = self.db_manager.db_uri + separator + urllib.parse.urlencode(
+                params, quote_via=urllib.parse.quote
+            )
             
-        return total_imported
+            conn = adbc_postgresql.connect(uri)
+            self._adbc_local.connection = conn
+            with self._adbc_lock:
+                self._adbc_connections.append(conn)
+        return conn
+    
+    def _close_adbc_connections(self) -> None:
+        """
+        Close the ADBC connections opened during the current import.
+        """
+        with self._adbc_lock:
+            connections, self._adbc_connections = self._adbc_connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except Exception as e:
+                logger.warning(f"Error closing ADBC connection: {str(e)}")
     
-    def _import_batch(self, batch: List[Dict[str, Any]]) -> int:
+    def _import_batch(self, batch: List[Tuple[Any, ...]]) -> int:
         """
         Import a batch of cities into the database.
         
         Args:
-            batch: List of city dictionaries to import
+            batch: City rows in IMPORT_COLUMNS order
             
         Returns:
             Number of cities imported
@@ -371,183 +1426,138 @@ class CityDataImporter:
             logger.error(f"Unsupported database type: {self.db_manager.db_type}")
             return 0
     
-    def _filter_valid_cities(self, batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """
-        Filter out invalid cities from a batch.
-        
-        Args:
-            batch: List of city dictionaries to filter
-            
-        Returns:
-            List of valid city dictionaries
-        """
-        valid_cities = []
-        for city in batch:
-            # Check for required fields
-            if not city.get('name') or not city.get('country_code'):
-                continue
-                
-            # Check for valid coordinates
-            try:
-                lat = float(city.get('lat', 0))
-                lng = float(city.get('lng', 0))
-                
-                if lat < -90 or lat > 90 or lng < -180 or lng > 180:
-                    continue
-            except (ValueError, TypeError):
-                continue
-                
-            # Ensure ID is an integer
-            try:
-                if 'id' in city and city['id'] is not None:
-                    city['id'] = int(city['id'])
-            except (ValueError, TypeError):
-                city['id'] = None
-                
-            # All checks passed, add to valid cities
-            valid_cities.append(city)
-            
-        return valid_cities
-    
-    def _import_batch_sqlite(self, cities: List[Dict[str, Any]]) -> int:
+    def _import_batch_sqlite(self, values: List[Tuple[Any, ...]]) -> int:
         """
         Import a batch of cities into a SQLite database.
         
         Args:
-            cities: List of city dictionaries to import
+            values: City rows in IMPORT_COLUMNS order
             
         Returns:
             Number of cities imported
         """
-        if not cities:
+        if not values:
             return 0
             
-        # Prepare the SQL query
-        columns = ['id', 'name', 'state_id', 'state_code', 'state_name', 
-                   'country_id', 'country_code', 'country_name', 
-                   'lat', 'lng', 'wikidata_id', 'population', 'timezone']
-                   
-        # Filter out None values for required fields
-        placeholders = ", ".join(["?"] * len(columns))
-        
-        sql = f"""
-        INSERT OR REPLACE INTO city_data ({", ".join(columns)})
-        VALUES ({placeholders})
-        """
+        sql = self._sqlite_insert_sql
         
-        # Prepare the values
-        values = []
-        for city in cities:
-            row = []
-            for col in columns:
-                row.append(city.get(col))
-            values.append(tuple(row))
+        # Inside an import-wide transaction, errors propagate so the whole
+        # import is rolled back rather than left half-applied
+        if self._bulk_connection is not None:
+            self._bulk_connection.executemany(sql, values)
+            return len(values)
         
         # Execute the query
         try:
             with self.db_manager.cursor() as cursor:
                 cursor.executemany(sql, values)
-            return len(cities)
+            return len(values)
         except Exception as e:
             logger.error(f"Error importing batch to SQLite: {str(e)}")
             return 0
     
-    def _import_batch_postgresql(self, cities: List[Dict[str, Any]]) -> int:
+    def _import_batch_postgresql(self, values: List[Tuple[Any, ...]]) -> int:
         """
         Import a batch of cities into a PostgreSQL database.
         
+        The batch is streamed with COPY, which skips per-row parsing and
+        planning. COPY cannot update conflicting rows, so if it is rejected the
+        batch is copied into a staging table and merged with ON CONFLICT
+        handling instead.
+        
         Args:
-            cities: List of city dictionaries to import
+            values: City rows in IMPORT_COLUMNS order
             
         Returns:
             Number of cities imported
         """
-        if not cities:
+        if not values:
             return 0
-            
-        # Prepare the SQL query
-        columns = ['id', 'name', 'state_id', 'state_code', 'state_name', 
-                   'country_id', 'country_code', 'country_name', 
-                   'lat', 'lng', 'wikidata_id', 'population', 'timezone']
-        
-        # Create placeholders for values
-        value_placeholders = []
-        for i, _ in enumerate(cities):
-            placeholders = []
-            for j, _ in enumerate(columns):
-                placeholders.append(f"${i*len(columns) + j + 1}")
-            value_placeholders.append(f"({', '.join(placeholders)})")
-        
-        sql = f"""
-        INSERT INTO city_data ({", ".join(columns)})
-        VALUES {", ".join(value_placeholders)}
-        ON CONFLICT (id) DO UPDATE SET
-            name = EXCLUDED.name,
-            state_id = EXCLUDED.state_id,
-            state_code = EXCLUDED.state_code,
-            state_name = EXCLUDED.state_name,
-            country_id = EXCLUDED.country_id,
-            country_code = EXCLUDED.country_code,
-            country_name = EXCLUDED.country_name,
-            lat = EXCLUDED.lat,
-            lng = EXCLUDED.lng,
-            wikidata_id = EXCLUDED.wikidata_id,
-            population = EXCLUDED.population,
-            timezone = EXCLUDED.timezone
-        """
-        
-        # Prepare values
-        values = []
-        for city in cities:
-            for col in columns:
-                values.append(city.get(col))
         
-        # Execute the query
+        import psycopg2
+        
+        buffer = _to_copy_csv(values)
+        
         try:
             with self.db_manager.cursor() as cursor:
-                cursor.execute(sql, values)
-            return len(cities)
+                cursor.copy_expert(self._pg_copy_sql, buffer)
+            return len(values)
+        except psycopg2.IntegrityError as e:
+            logger.warning(f"COPY rejected by PostgreSQL ({str(e)}), merging through staging table")
         except Exception as e:
             logger.error(f"Error importing batch to PostgreSQL: {str(e)}")
             return 0
-
-    def _update_postgis_geometry(self) -> None:
+        
+        buffer.seek(0)
+        return self._merge_batch_postgresql(buffer, values)
+    
+    def _merge_batch_postgresql(self, buffer: io.StringIO, values: List[Tuple[Any, ...]]) -> int:
         """
-        Update the geometry column in the PostgreSQL database.
-        For PostGIS database only.
+        Merge a CSV batch into PostgreSQL, updating rows whose ID already exists.
+        
+        The batch is still loaded with COPY, into a temporary table, so only the
+        final INSERT ... SELECT pays for conflict checks. If the merge hits some
+        other constraint the rows are inserted with error isolation instead.
+        
+        Args:
+            buffer: The batch written as CSV, positioned at the start
+            values: The same rows as tuples in IMPORT_COLUMNS order
+            
+        Returns:
+            Number of rows imported
         """
+        import psycopg2
+        
         try:
-            if self.db_manager.db_type != 'postgresql':
-                return
-                
-            # Check if PostGIS is installed
             with self.db_manager.cursor() as cursor:
-                cursor.execute("SELECT PostGIS_Version()")
-                result = cursor.fetchone()
-                if not result:
-                    logger.warning("PostGIS not installed. Skipping geometry update.")
-                    return
-                    
-                # Update the geometry column
-                cursor.execute("""
-                UPDATE city_data
-                SET geom = ST_SetSRID(ST_MakePoint(lng, lat), 4326)
-                WHERE geom IS NULL
-                """)
-                
-            logger.info("Updated PostGIS geometry column")
+                cursor.execute(self._pg_staging_sql)
+                cursor.copy_expert(self._pg_staging_copy_sql, buffer)
+                cursor.execute(self._pg_merge_sql)
+                return cursor.rowcount
+        except psycopg2.IntegrityError as e:
+            logger.warning(f"Staged merge rejected by PostgreSQL ({str(e)}), falling back to INSERT")
         except Exception as e:
-            logger.error(f"Error updating PostGIS geometry column: {str(e)}")
-
-def clean_row(row: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Clean a single row of data.
+            logger.error(f"Error importing batch to PostgreSQL: {str(e)}")
+            return 0
+        
+        return self._insert_batch_postgresql(values)
     
-    Args:
-        row: Dictionary representing a row of data
+    def _insert_batch_postgresql(self, values: List[Tuple[Any, ...]]) -> int:
+        """
+        Insert rows into PostgreSQL, updating rows whose ID already exists.
         
-    Returns:
-        Cleaned row dictionary
-    """
-    # Current code removes rows with missing values but doesn't handle country_code specifically
-    return row 
\ No newline at end of file
+        A batch rejected by a constraint is split in half and each half retried
+        as one statement, so a bad row costs O(log n) round trips to isolate
+        instead of one per row in the batch.
+        
+        Args:
+            values: Row tuples in IMPORT_COLUMNS order
+            
+        Returns:
+            Number of rows imported
+        """
+        import psycopg2
+        from psycopg2.extras import execute_values
+        
+        # Send the rows as a single multi-row INSERT
+        try:
+            with self.db_manager.cursor() as cursor:
+                execute_values(
+                    cursor, self._pg_insert_sql, values,
+                    template=self._pg_insert_template, page_size=len(values)
+                )
+            return len(values)
+        except psycopg2.IntegrityError as e:
+            if len(values) == 1:
+                logger.warning(f"Skipping city {values[0][0]}: {str(e)}")
+                return 0
+        except Exception as e:
+            logger.error(f"Error importing batch to PostgreSQL: {str(e)}")
+            return 0
+        
+        # Isolate the offending rows so the rest of the batch still lands
+        middle = len(values) // 2
+        return (
+            self._insert_batch_postgresql(values[:middle])
+            + self._insert_batch_postgresql(values[middle:])
+        )
@@ -5,9 +5,16 @@ This module provides repository classes for accessing and querying city data
 in the GeoDash database.
 """
 
+import bisect
 import math
-from typing import Dict, List, Any, Tuple, Optional, Union, ClassVar, Type, TypeVar, Set
-from functools import lru_cache
+import numpy as np
+from typing import Dict, List, Any, Tuple, Optional, Union, ClassVar, Type, TypeVar, Set, Callable, Hashable, Iterator
+import functools
+import hashlib
+import heapq
+import json
+from collections import OrderedDict
+from operator import itemgetter
 import time
 import asyncio
 import os
@@ -19,6 +26,7 @@ from multiprocessing import shared_memory, Lock
 import tempfile
 import atexit
 
+from GeoDash.config.schema import is_valid_fuzzy_scorer
 from GeoDash.data.database import DatabaseManager
 from GeoDash.utils.logging import get_logger
 
@@ -41,6 +49,13 @@ except ImportError:
     logger = get_logger(__name__)
     logger.warning("pygtrie not found, using slower dictionary lookups. Install pygtrie for better performance.")
 
+# For JIT-compiled, multi-threaded distance computation (optional)
+try:
+    from numba import njit, prange
+    USING_NUMBA = True
+except ImportError:
+    USING_NUMBA = False
+
 # Get logger for this module
 logger = get_logger(__name__, {"component": "repositories"})
 
@@ -423,6 +438,398 @@ def get_region_repository(db_manager: DatabaseManager) -> 'RegionRepository':
     
     return _region_repository_instance
 
+# Rows fetched per round trip when streaming large result sets
+_FETCH_BATCH_SIZE = 10000
+
+def _iter_rows(cursor: Any) -> Iterator[Any]:
+    """
+    Yield the rows of an executed query, fetched in batches of _FETCH_BATCH_SIZE
+    so the full result set is never materialized at once.
+    """
+    while True:
+        batch = cursor.fetchmany(_FETCH_BATCH_SIZE)
+        if not batch:
+            return
+        yield from batch
+
+# Longest query the 'auto' fuzzy scorer treats as short: short queries are
+# scored with the plain Indel ratio, longer ones with WRatio
+_SHORT_FUZZY_QUERY_LENGTH = 20
+
+# Below this many points the NumPy expression beats starting Numba's threads
+_NUMBA_MIN_POINTS = 2048
+
+def _haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Great-circle distance in kilometers between two points given in degrees.
+    
+    Replaced by a Numba-compiled version of the same code when numba is installed.
+    """
+    lat1 = math.radians(lat1)
+    lat2 = math.radians(lat2)
+    a = (math.sin((lat2 - lat1) / 2) ** 2
+         + math.cos(lat1) * math.cos(lat2) * math.sin(math.radians(lon2 - lon1) / 2) ** 2)
+    # Rounding can push a slightly above 1 for antipodal points
+    return 2 * math.asin(math.sqrt(min(a, 1.0))) * 6371
+
+if USING_NUMBA:
+    _haversine_km = njit(cache=True)(_haversine_km)
+    
+    @njit(parallel=True, cache=True)
+    def _haversine_kernel(lat1: float, lng1: float, lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+        """
+        Great-circle distances in kilometers from one point, given in radians,
+        to many points given in degrees, computed in parallel.
+        """
+        cos_lat1 = math.cos(lat1)
+        distances = np.empty(lats.shape[0], dtype=np.float64)
+        for i in prange(lats.shape[0]):
+            lat2 = math.radians(lats[i])
+            a = (math.sin((lat2 - lat1) / 2) ** 2
+                 + cos_lat1 * math.cos(lat2) * math.sin((math.radians(lngs[i]) - lng1) / 2) ** 2)
+            distances[i] = 2 * math.asin(math.sqrt(min(a, 1.0))) * 6371
+        return distances
+
+def _haversine_km_many(lat: float, lng: float, lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+    """
+    Great-circle distances in kilometers from one point to many points, all
+    given in degrees, using the parallel Numba kernel for large inputs.
+    """
+    if USING_NUMBA and lats.shape[0] >= _NUMBA_MIN_POINTS:
+        return _haversine_kernel(math.radians(lat), math.radians(lng), lats, lngs)
+    
+    lat1 = math.radians(lat)
+    lat2 = np.radians(lats)
+    dlat = lat2 - lat1
+    dlon = np.radians(lngs) - math.radians(lng)
+    a = np.sin(dlat / 2) ** 2 + math.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    # Rounding can push a slightly above 1 for antipodal points
+    c = 2 * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+    return c * 6371
+
+# Result columns with few distinct values that are repeated across many rows
+_INTERNED_COLUMNS = frozenset({'country', 'country_code', 'state', 'state_code'})
+
+# PostgreSQL full-text search statements, built once and keyed by
+# (country filter, location ranking) so each call only binds parameters
+_PG_SEARCH_SQL: Dict[Tuple[bool, bool], str] = {}
+for _has_country in (False, True):
+    for _has_location in (False, True):
+        # The rank is only ordered by, not selected, so it is not returned
+        _PG_SEARCH_SQL[(_has_country, _has_location)] = (
+            "SELECT id, name, ascii_name, country, country_code, state, state_code, lat, lng "
+            "FROM city_data "
+            "WHERE search_vector @@ to_tsquery('english', %s)"
+            + (" AND lower(country) = %s" if _has_country else "")
+            + " ORDER BY ts_rank(search_vector, to_tsquery('english', %s))"
+            + (" * 0.7 + (1.0 / (1.0 + (point(lng, lat) <-> point(%s, %s)))) * 0.3" if _has_location else "")
+            + " DESC, population DESC NULLS LAST"
+            + " LIMIT %s"
+        )
+del _has_country, _has_location
+
+# Fallback search cache settings, matching the configuration defaults
+_DEFAULT_CACHE_SIZE = 5000
+_DEFAULT_CACHE_TTL = 3600
+
+def _copy_result(value: Any) -> Any:
+    """
+    Copy a cached result so callers cannot mutate the cached rows.
+    
+    Rows only hold scalars, so copying each row dict is enough.
+    """
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, list):
+        return [dict(row) if isinstance(row, dict) else row for row in value]
+    return value
+
+class _TTLCache:
+    """
+    A thread-safe LRU cache whose entries expire after a fixed time-to-live.
+    """
+    
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """
+        Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of entries kept; the least recently used are evicted
+            ttl: Number of seconds an entry stays valid
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: 'OrderedDict[Hashable, Tuple[float, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Look up a key.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Tuple of (hit, value); value is None on a miss
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False, None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return False, None
+            self._entries.move_to_end(key)
+            return True, entry[1]
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entries if full.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+def _to_json_value(value: Any) -> Any:
+    """
+    Prepare a result for JSON, tagging tuples so they are restored as tuples.
+    """
+    if isinstance(value, tuple):
+        return {'__tuple__': [_to_json_value(item) for item in value]}
+    if isinstance(value, list):
+        return [_to_json_value(item) for item in value]
+    if isinstance(value, dict):
+        return {k: _to_json_value(v) for k, v in value.items()}
+    return value
+
+def _from_json_object(obj: Dict[str, Any]) -> Any:
+    """json.loads object hook undoing the tuple tagging of _to_json_value."""
+    if len(obj) == 1 and '__tuple__' in obj:
+        return tuple(obj['__tuple__'])
+    return obj
+
+# Seconds between flushes of pending persistent cache writes, and the number
+# of pending entries that triggers an earlier flush
+_PERSISTENT_CACHE_FLUSH_INTERVAL = 5.0
+_PERSISTENT_CACHE_FLUSH_SIZE = 100
+
+class _PersistentCache:
+    """
+    A result cache stored in the GeoDash database's search_cache table.
+    
+    Entries survive process restarts and are shared by every process using
+    the database. Values are stored as JSON, so only JSON-serializable
+    results can be cached.
+    
+    Lookups only read the table. New entries are queued and written in
+    batches by a background thread, so a cache miss never waits on a write
+    lock (e.g. one held by a running SQLite import). Queued entries that
+    have not been flushed when the process exits are lost.
+    """
+    
+    def __init__(self, db_manager: DatabaseManager, ttl: float) -> None:
+        """
+        Initialize the cache.
+        
+        Args:
+            db_manager: The database manager of the database holding the cache
+            ttl: Number of seconds an entry stays valid
+        """
+        self.db_manager = db_manager
+        self.ttl = ttl
+        self._param = '?' if db_manager.db_type == 'sqlite' else '%s'
+        self._table_ready = False
+        
+        # Entries waiting to be written, by stored key
+        self._pending: Dict[str, Tuple[Any, int]] = {}
+        self._pending_lock = threading.Lock()
+        self._flush_requested = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        self._writer_db: Optional[DatabaseManager] = None
+    
+    def _digest(self, name: str, key: Hashable) -> str:
+        """Build the stored key from the method name and its cache key."""
+        raw = json.dumps([name, key], default=str, ensure_ascii=False)
+        return hashlib.blake2b(raw.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _ensure_table(self, cursor: Any) -> None:
+        """Create the search_cache table on first write."""
+        if not self._table_ready:
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS search_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    result TEXT NOT NULL,
+                    created_at BIGINT NOT NULL
+                )
+            """)
+            self._table_ready = True
+    
+    def get(self, name: str, key: Hashable) -> Tuple[bool, Any]:
+        """
+        Look up a cached result.
+        
+        Args:
+            name: Name of the cached method
+            key: Cache key built from the method arguments
+            
+        Returns:
+            Tuple of (hit, value); value is None on a miss
+        """
+        try:
+            with self.db_manager.cursor() as cursor:
+                cursor.execute(
+                    f"SELECT result FROM search_cache WHERE cache_key = {self._param} AND created_at >= {self._param}",
+                    (self._digest(name, key), int(time.time() - self.ttl))
+                )
+                row = cursor.fetchone()
+        except Exception as e:
+            # The table does not exist until the first batch is written
+            if self._table_ready:
+                logger.warning(f"Error reading persistent search cache: {str(e)}")
+            return False, None
+        if row is None:
+            return False, None
+        return True, json.loads(row['result'] if isinstance(row, dict) else row[0],
+                                object_hook=_from_json_object)
+    
+    def set(self, name: str, key: Hashable, value: Any) -> None:
+        """
+        Queue a result to be stored, replacing any earlier entry for the same key.
+        
+        Args:
+            name: Name of the cached method
+            key: Cache key built from the method arguments
+            value: JSON-serializable result to store
+        """
+        with self._pending_lock:
+            self._pending[self._digest(name, key)] = (value, int(time.time()))
+            pending = len(self._pending)
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._write_pending, name='geodash-search-cache', daemon=True
+                )
+                self._writer.start()
+        if pending >= _PERSISTENT_CACHE_FLUSH_SIZE:
+            self._flush_requested.set()
+    
+    def _write_pending(self) -> None:
+        """Background thread body: flush queued entries periodically."""
+        while True:
+            self._flush_requested.wait(_PERSISTENT_CACHE_FLUSH_INTERVAL)
+            self._flush_requested.clear()
+            self.flush()
+    
+    def flush(self) -> None:
+        """Write all queued entries to the table in one batch."""
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        
+        rows = [
+            (cache_key, json.dumps(_to_json_value(value), ensure_ascii=False), created_at)
+            for cache_key, (value, created_at) in pending.items()
+        ]
+        try:
+            # A persistent SQLite connection cannot be used from this thread
+            db_manager = self.db_manager
+            if db_manager.persistent:
+                if self._writer_db is None:
+                    self._writer_db = DatabaseManager(db_manager.db_uri)
+                db_manager = self._writer_db
+            with db_manager.cursor() as cursor:
+                self._ensure_table(cursor)
+                cursor.executemany(
+                    f"INSERT INTO search_cache (cache_key, result, created_at) "
+                    f"VALUES ({self._param}, {self._param}, {self._param}) "
+                    "ON CONFLICT (cache_key) DO UPDATE SET result = excluded.result, created_at = excluded.created_at",
+                    rows
+                )
+        except Exception as e:
+            logger.warning(f"Error writing {len(rows)} entries to persistent search cache: {str(e)}")
+    
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._pending_lock:
+            self._pending.clear()
+        try:
+            with self.db_manager.cursor() as cursor:
+                self._ensure_table(cursor)
+                cursor.execute("DELETE FROM search_cache")
+        except Exception as e:
+            logger.warning(f"Error clearing persistent search cache: {str(e)}")
+
+def _cached(maxsize: Optional[int] = None, key: Optional[Callable[..., Hashable]] = None,
+            persistent: bool = False) -> Callable:
+    """
+    Cache a repository method's results on the repository instance.
+    
+    Unlike functools.lru_cache on a method, the cache does not hold a reference
+    to the repository, and entries expire after the configured search cache
+    TTL so results from before a data reload are not served forever. Callers
+    get a copy of the cached rows, so mutating a result does not alter the cache.
+    
+    Args:
+        maxsize: Maximum number of entries; defaults to the configured cache size
+        key: Function building the cache key from the method arguments
+            (excluding self); defaults to the arguments themselves
+        persistent: Whether to fall back to the repository's persistent cache
+            (search.cache.persistent) on a miss, and queue results to be
+            written to it in the background
+            
+    Returns:
+        Method decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        name = func.__name__
+        
+        @functools.wraps(func)
+        def wrapper(self: 'BaseRepository', *args: Any, **kwargs: Any) -> Any:
+            cache = self._caches.get(name)
+            if cache is None:
+                size, ttl = _DEFAULT_CACHE_SIZE, _DEFAULT_CACHE_TTL
+                try:
+                    from GeoDash.config.manager import get_config
+                    cache_settings = get_config().get_cache_settings()
+                    size = cache_settings.get('size', size)
+                    ttl = cache_settings.get('ttl', ttl)
+                except Exception:
+                    pass
+                cache = self._caches.setdefault(name, _TTLCache(maxsize or size, ttl))
+            
+            cache_key = key(*args, **kwargs) if key else (args, tuple(sorted(kwargs.items())))
+            hit, value = cache.get(cache_key)
+            if hit:
+                return _copy_result(value)
+            
+            persistent_cache = self._persistent_cache() if persistent else None
+            if persistent_cache is not None:
+                hit, value = persistent_cache.get(name, cache_key)
+                if hit:
+                    cache.set(cache_key, value)
+                    return _copy_result(value)
+            
+            value = func(self, *args, **kwargs)
+            cache.set(cache_key, value)
+            if persistent_cache is not None:
+                persistent_cache.set(name, cache_key, value)
+            return _copy_result(value)
+        
+        return wrapper
+    
+    return decorator
+
 class BaseRepository:
     """
     Base repository class for city data.
@@ -537,6 +944,38 @@ class BaseRepository:
         """
         self.db_manager = db_manager
         self.table_name = 'city_data'
+        
+        # Result caches of the @_cached methods, by method name
+        self._caches: Dict[str, _TTLCache] = {}
+        self._persistent: Optional[_PersistentCache] = None
+    
+    def _persistent_cache(self) -> Optional[_PersistentCache]:
+        """
+        Get the database-backed result cache, if enabled in the configuration.
+        
+        Returns:
+            The persistent cache, or None if search.cache.persistent is off
+        """
+        if self._persistent is None:
+            try:
+                from GeoDash.config.manager import get_config
+                cache_settings = get_config().get_cache_settings()
+            except Exception:
+                return None
+            if not (cache_settings.get('enabled', True) and cache_settings.get('persistent', False)):
+                return None
+            self._persistent = _PersistentCache(self.db_manager, cache_settings.get('ttl', _DEFAULT_CACHE_TTL))
+        return self._persistent
+    
+    def clear_caches(self) -> None:
+        """
+        Drop all cached query results, e.g. after the city data is reloaded.
+        """
+        for cache in self._caches.values():
+            cache.clear()
+        persistent_cache = self._persistent_cache()
+        if persistent_cache is not None:
+            persistent_cache.clear()
     
     def __del__(self) -> None:
         """Destructor to ensure shared memory is cleaned up when the repository is garbage collected."""
@@ -548,6 +987,26 @@ class BaseRepository:
             # Avoid errors during garbage collection
             logger.debug(f"Error during repository cleanup on garbage collection: {str(e)}")
     
+    def _page_clause(self, limit: Optional[int], offset: int) -> Tuple[str, List[Optional[int]]]:
+        """
+        Build the LIMIT/OFFSET clause for a paginated query.
+        
+        Args:
+            limit: Maximum number of rows, or None for no limit
+            offset: Number of leading rows to skip
+            
+        Returns:
+            Tuple of (SQL clause, its parameters); the clause is empty when
+            the query is not paginated
+        """
+        if limit is None and not offset:
+            return "", []
+        param = '?' if self.db_manager.db_type == 'sqlite' else '%s'
+        if limit is None:
+            # SQLite needs a LIMIT to accept OFFSET; PostgreSQL reads NULL as no limit
+            limit = -1 if self.db_manager.db_type == 'sqlite' else None
+        return f" LIMIT {param} OFFSET {param}", [limit, offset]
+    
     def _row_to_dict(self, row: Tuple, columns: List[str]) -> Dict[str, Any]:
         """
         Convert a database row to a dictionary using column names.
@@ -572,7 +1031,22 @@ class BaseRepository:
         Returns:
             List of dictionary representations of the rows
         """
-        return [self._row_to_dict(row, columns) for row in rows]
+        # Zip each row with the columns directly rather than making a
+        # _row_to_dict call per row
+        columns = tuple(columns)
+        results = [dict(zip(columns, row)) for row in rows]
+        
+        # Share one string object per distinct country/state value across
+        # the rows instead of keeping a copy in each of them
+        interned = [col for col in columns if col in _INTERNED_COLUMNS]
+        if interned and len(results) > 1:
+            intern = sys.intern
+            for result in results:
+                for col in interned:
+                    value = result[col]
+                    if type(value) is str:
+                        result[col] = intern(value)
+        return results
 
 class CityRepository(BaseRepository):
     """
@@ -594,11 +1068,49 @@ class CityRepository(BaseRepository):
         self.city_names: Dict[str, List[int]] = {}  # Map of lowercase city name to list of city IDs
         self.ascii_names: Dict[str, List[int]] = {} # Map of lowercase ASCII name to list of city IDs
         self.country_cities: Dict[str, List[int]] = {} # Map of country to list of city IDs
+        self._country_city_ids: Dict[str, frozenset] = {} # Map of country to set of city IDs
+        
+        # Flat fuzzy-matching candidates: every distinct lowercase name/ASCII
+        # name of a city, with the matching city ID at the same position
+        self._all_names: List[str] = []
+        self._all_name_ids = np.empty(0, dtype=np.int64)
+        # The same candidates split by lowercase country
+        self._names_by_country: Dict[str, Tuple[List[str], np.ndarray]] = {}
+        
+        # Columns of city_index in load order, for whole-index scans
+        self._column_ids = np.empty(0, dtype=np.int64)
+        self._column_ascii_names: List[str] = []  # Lowercase ASCII names
+        self._column_ascii_lengths = np.empty(0, dtype=np.int64)
+        self._column_country_codes = np.empty(0, dtype=object)
         
         # Trie data structures for efficient prefix matching
         if USING_TRIE:
             self.name_trie = trie.CharTrie()
             self.ascii_trie = trie.CharTrie()
+        else:
+            # Sorted name keys for binary-search prefix matching
+            self._sorted_names: List[str] = []
+            self._sorted_ascii_names: List[str] = []
+        
+        # Scorer for background fuzzy matching, from search.fuzzy.scorer;
+        # None picks one per query (see _get_fuzzy_scorer)
+        self._fuzzy_scorer: Optional[Callable[..., float]] = None
+        try:
+            from GeoDash.config.manager import get_config
+            scorer_name = get_config().get_fuzzy_settings().get('scorer', 'auto')
+        except Exception:
+            scorer_name = 'auto'
+        if not is_valid_fuzzy_scorer(scorer_name):
+            logger.warning(f"Unknown fuzzy scorer {scorer_name!r}, using 'auto'")
+        elif scorer_name != 'auto':
+            self._fuzzy_scorer = getattr(fuzz, scorer_name)
+        
+        # The search backend depends only on the database type, so it is
+        # chosen once here instead of on every search call
+        if db_manager.db_type == 'postgresql':
+            self._search_backend = self._perform_postgresql_search
+        else:
+            self._search_backend = self._search_in_memory
         
         # Load cities into memory for fast searching
         if initialize:
@@ -606,6 +1118,18 @@ class CityRepository(BaseRepository):
             self._load_cities()
             logger.info(f"Cities loaded in {time.time() - start_time:.2f} seconds")
         
+    def _persistent_cache(self) -> Optional[_PersistentCache]:
+        """
+        Get the database-backed result cache, unless this repository has no
+        in-memory index to search (its SQLite results would all be empty).
+        
+        Returns:
+            The persistent cache, or None if disabled or not usable
+        """
+        if self.db_manager.db_type == 'sqlite' and not self.city_index:
+            return None
+        return super()._persistent_cache()
+    
     def _load_cities(self):
         """Load all cities into memory for fast search."""
         logger.info("Loading all cities into memory for fast search...")
@@ -616,11 +1140,13 @@ class CityRepository(BaseRepository):
                     FROM city_data
                 """)
                 
-                columns = ['id', 'name', 'ascii_name', 'country', 'country_code', 
-                          'state', 'state_code', 'lat', 'lng']
+                columns = ('id', 'name', 'ascii_name', 'country', 'country_code', 
+                           'state', 'state_code', 'lat', 'lng')
+                all_name_ids = []
+                names_by_country: Dict[str, Tuple[List[str], List[int]]] = {}
                 
-                for row in cursor.fetchall():
-                    city = self._row_to_dict(row, columns)
+                for row in _iter_rows(cursor):
+                    city = dict(zip(columns, row))
                     city_id = city['id']
                     name_lower = city['name'].lower()
                     ascii_lower = city['ascii_name'].lower()
@@ -628,6 +1154,19 @@ class CityRepository(BaseRepository):
                     
                     # Store city data by ID
                     self.city_index[city_id] = city
+                    self._column_ascii_names.append(ascii_lower)
+                    
+                    # Add to the flat and per-country fuzzy-matching candidates
+                    country_names, country_name_ids = names_by_country.setdefault(country, ([], []))
+                    self._all_names.append(name_lower)
+                    all_name_ids.append(city_id)
+                    country_names.append(name_lower)
+                    country_name_ids.append(city_id)
+                    if ascii_lower != name_lower:
+                        self._all_names.append(ascii_lower)
+                        all_name_ids.append(city_id)
+                        country_names.append(ascii_lower)
+                        country_name_ids.append(city_id)
                     
                     # Add to name lookup
                     if name_lower not in self.city_names:
@@ -654,11 +1193,30 @@ class CityRepository(BaseRepository):
                             self.ascii_trie[ascii_lower] = []
                         self.ascii_trie[ascii_lower].append(city_id)
                 
+                self._all_name_ids = np.asarray(all_name_ids, dtype=np.int64)
+                self._names_by_country = {
+                    country: (names, np.asarray(ids, dtype=np.int64))
+                    for country, (names, ids) in names_by_country.items()
+                }
+                cities = self.city_index.values()
+                self._column_ids = np.fromiter(self.city_index, dtype=np.int64, count=len(cities))
+                self._column_ascii_lengths = np.fromiter(
+                    (len(city['ascii_name']) for city in cities), dtype=np.int64, count=len(cities)
+                )
+                self._column_country_codes = np.array(
+                    [city['country_code'] for city in cities], dtype=object
+                )
+                self._country_city_ids = {
+                    country: frozenset(ids) for country, ids in self.country_cities.items()
+                }
+                if not USING_TRIE:
+                    self._sorted_names = sorted(self.city_names)
+                    self._sorted_ascii_names = sorted(self.ascii_names)
                 logger.info(f"Loaded {len(self.city_index)} cities into memory")
         except Exception as e:
             logger.error(f"Error loading cities: {str(e)}", exc_info=True)
     
-    @lru_cache(maxsize=1000)
+    @_cached(maxsize=1000)
     def get_by_id(self, city_id: int) -> Optional[Dict[str, Any]]:
         """
         Get a city by its ID.
@@ -733,22 +1291,22 @@ class CityRepository(BaseRepository):
                 # No matches found in the trie
                 pass
         else:
-            # Fall back to dictionary lookup
-            for name, ids in self.city_names.items():
-                if name.startswith(query):
-                    prefix_match_ids.extend(ids)
-            
-            for name, ids in self.ascii_names.items():
-                if name.startswith(query):
-                    prefix_match_ids.extend(ids)
+            # Fall back to a binary search over the sorted name keys; names
+            # sharing the prefix are contiguous from the insertion point
+            for sorted_names, lookup in ((self._sorted_names, self.city_names),
+                                         (self._sorted_ascii_names, self.ascii_names)):
+                i = bisect.bisect_left(sorted_names, query)
+                while i < len(sorted_names) and sorted_names[i].startswith(query):
+                    prefix_match_ids.extend(lookup[sorted_names[i]])
+                    i += 1
         
         # Filter by country if needed
         if country:
-            country_lower = country.lower()
-            prefix_match_ids = [city_id for city_id in prefix_match_ids 
-                             if self.city_index[city_id]['country'] is not None and self.city_index[city_id]['country'].lower() == country_lower]
+            country_ids = self._country_city_ids.get(country.lower(), frozenset())
+            prefix_match_ids = [city_id for city_id in prefix_match_ids if city_id in country_ids]
                 
-        return list(set(prefix_match_ids))
+        # Drop duplicates, keeping the order the matches were found in
+        return list(dict.fromkeys(prefix_match_ids))
     
     def _perform_postgresql_search(
         self, 
@@ -757,6 +1315,8 @@ class CityRepository(BaseRepository):
         country: Optional[str] = None,
         user_lat: Optional[float] = None,
         user_lng: Optional[float] = None,
+        user_country: Optional[str] = None,
+        fuzzy_threshold: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         Perform a PostgreSQL-specific full-text search using the tsvector column.
@@ -767,6 +1327,8 @@ class CityRepository(BaseRepository):
             country: Optional country filter
             user_lat: User's latitude for location-aware prioritization
             user_lng: User's longitude for location-aware prioritization
+            user_country: Unused; accepted so both search backends share a signature
+            fuzzy_threshold: Unused; full-text ranking replaces fuzzy matching
             
         Returns:
             List of matching cities as dictionaries
@@ -776,59 +1338,39 @@ class CityRepository(BaseRepository):
             # Split the query into words
             query_words = query.strip().lower().split()
             
-            # Build the SQL query with parameters
-            sql = f"""
-                SELECT id, name, ascii_name, country, country_code, state, state_code, lat, lng,
-                       ts_rank(search_vector, to_tsquery('english', %s)) AS rank
-                FROM {self.db_manager.city_table_name}
-                WHERE search_vector @@ to_tsquery('english', %s)
-            """
-            
             # Create the tsquery parameter (words connected by &)
             tsquery_param = ' & '.join(query_words) if query_words else ""
-            params = [tsquery_param, tsquery_param]
+            params = [tsquery_param]
             
             # Add country filter if specified
             if country:
-                sql += " AND lower(country) = %s"
                 params.append(country.lower())
+            params.append(tsquery_param)
                 
-            # Add location-based ranking if coordinates provided
-            if user_lat is not None and user_lng is not None:
-                # Incorporate distance into ranking using the <-> operator
-                sql += """
-                    ORDER BY 
-                        rank * 0.7 + 
-                        (1.0 / (1.0 + (point(lng, lat) <-> point(%s, %s)))) * 0.3
-                    DESC
-                """
+            # Incorporate distance into the ranking if coordinates provided
+            has_location = user_lat is not None and user_lng is not None
+            if has_location:
                 params.extend([user_lng, user_lat])
-            else:
-                # Order by rank only
-                sql += " ORDER BY rank DESC"
                 
-            # Add limit
-            sql += " LIMIT %s"
             params.append(limit)
+            sql = _PG_SEARCH_SQL[(bool(country), has_location)]
             
             # Execute the query
             with self.db_manager.cursor() as cursor:
                 cursor.execute(sql, params)
                 columns = [desc[0] for desc in cursor.description]
-                results = self._rows_to_dicts(cursor.fetchall(), columns)
-                
-                # Clean up result data
-                for city in results:
-                    city.pop('rank', None)
-                    
-                return results
+                return self._rows_to_dicts(cursor.fetchall(), columns)
                 
         except Exception as e:
             logger.error(f"PostgreSQL full-text search error: {str(e)}", exc_info=True)
             # Fall back to regular search on error
             return []
 
-    @lru_cache(maxsize=5000)
+    @_cached(key=lambda query, limit=10, country=None, user_lat=None, user_lng=None,
+             user_country=None, fuzzy_threshold=None: (
+        query.strip().lower(), limit, country, user_lat, user_lng,
+        user_country.lower() if user_country is not None else None, fuzzy_threshold
+    ), persistent=True)
     def search(
         self, 
         query: str, 
@@ -860,8 +1402,6 @@ class CityRepository(BaseRepository):
         Returns:
             List of matching cities as dictionaries, sorted by relevance and location
         """
-        start_time = time.time()
-        
         # Try to get the config instance if available
         try:
             from GeoDash.config.manager import get_config
@@ -872,8 +1412,8 @@ class CityRepository(BaseRepository):
             cache_enabled = cache_settings.get('enabled', True)
             
             # If caching is disabled, clear the cache
-            if not cache_enabled:
-                self.search.cache_clear()
+            if not cache_enabled and 'search' in self._caches:
+                self._caches['search'].clear()
             
             # Get fuzzy search settings if not provided
             if fuzzy_threshold is None:
@@ -901,24 +1441,47 @@ class CityRepository(BaseRepository):
         if not query:
             return []
             
-        if self.db_manager.db_type == 'postgresql':
-            # PostgreSQL can use advanced search features
-            return self._perform_postgresql_search(query, limit, country, user_lat, user_lng)
+        return self._search_backend(query, limit, country, user_lat, user_lng, user_country, fuzzy_threshold)
+    
+    def _search_in_memory(
+        self, 
+        query: str, 
+        limit: int, 
+        country: Optional[str],
+        user_lat: Optional[float],
+        user_lng: Optional[float],
+        user_country: Optional[str],
+        fuzzy_threshold: Optional[int]
+    ) -> List[Dict[str, Any]]:
+        """
+        Search the in-memory city index, used for SQLite databases.
         
-        # Get the name column to search based on the database type
-        name_column = 'ascii_name' if self.db_manager.db_type == 'sqlite' else 'name'
+        Args:
+            query: Normalized (stripped, lowercase) search query
+            limit: Maximum number of results to return
+            country: Optional country code to filter results
+            user_lat: User's latitude for location-awareness
+            user_lng: User's longitude for location-awareness
+            user_country: User's country for location-based prioritization
+            fuzzy_threshold: Threshold for fuzzy matching (0-100), None to disable
+            
+        Returns:
+            List of matching cities as dictionaries, sorted by relevance and location
+        """
+        start_time = time.time()
         
         # Find exact matches
-        exact_match_ids = []
-        for city_id, city in self.city_index.items():
-            if (country is None or city['country_code'] == country) and city[name_column].lower() == query:
-                exact_match_ids.append(city_id)
+        exact_match_ids = [
+            city_id for city_id in self.ascii_names.get(query, ())
+            if country is None or self.city_index[city_id]['country_code'] == country
+        ]
         
         # Find prefix matches (starts with the query)
-        prefix_match_ids = list(self._get_prefix_matches(query, country))
+        prefix_match_ids = self._get_prefix_matches(query, country)
         
         # Remove any prefix matches that are also exact matches to avoid duplicates
-        prefix_match_ids = [pid for pid in prefix_match_ids if pid not in exact_match_ids]
+        matched_ids = set(exact_match_ids)
+        prefix_match_ids = [pid for pid in prefix_match_ids if pid not in matched_ids]
         
         # Prepare the result dictionary
         results = []
@@ -941,11 +1504,26 @@ class CityRepository(BaseRepository):
         if fuzzy_threshold is not None:
             candidate_cities = []
             
-            # Create a list of candidates to perform fuzzy matching on
-            for city_id, city in self.city_index.items():
-                if city_id not in exact_match_ids and city_id not in prefix_match_ids:
-                    if country is None or city['country_code'] == country:
-                        candidate_cities.append((city_id, city[name_column].lower()))
+            # fuzz.ratio is at most 200 * shorter / (len1 + len2), so names too
+            # short or too long to reach the threshold are never scored (the
+            # half-point margin covers fuzzywuzzy rounding its scores)
+            cutoff = fuzzy_threshold - 0.5
+            query_len = len(query)
+            min_len = cutoff * query_len / (200 - cutoff) if cutoff > 0 else 0
+            max_len = query_len * (200 - cutoff) / cutoff if cutoff > 0 else float('inf')
+            
+            # Create a list of candidates to perform fuzzy matching on,
+            # filtering the index columns instead of every city dict
+            mask = (self._column_ascii_lengths >= min_len) & (self._column_ascii_lengths <= max_len)
+            if country is not None:
+                mask &= self._column_country_codes == country
+            matched_ids.update(prefix_match_ids)
+            city_ids = self._column_ids
+            ascii_names = self._column_ascii_names
+            for i in np.flatnonzero(mask).tolist():
+                city_id = int(city_ids[i])
+                if city_id not in matched_ids:
+                    candidate_cities.append((city_id, ascii_names[i]))
             
             # Perform fuzzy matching
             if candidate_cities:
@@ -954,11 +1532,8 @@ class CityRepository(BaseRepository):
                     if score >= fuzzy_threshold:
                         fuzzy_matches.append((city_id, score))
                 
-                # Sort fuzzy matches by score (descending)
-                fuzzy_matches.sort(key=lambda x: x[1], reverse=True)
-                
-                # Add fuzzy matches to results
-                for city_id, _ in fuzzy_matches[:limit]:
+                # Add the best fuzzy matches to results, by score (descending)
+                for city_id, _ in heapq.nlargest(limit, fuzzy_matches, key=itemgetter(1)):
                     results.append(self.city_index[city_id].copy())
         
         # Apply location-based prioritization
@@ -1001,50 +1576,45 @@ class CityRepository(BaseRepository):
             # Flag to check if we need to sort by multiple criteria
             has_geo_sort = user_lat is not None and user_lng is not None
             has_country_sort = user_country is not None
+            user_country_lower = user_country.lower() if has_country_sort else None
+            
+            # Score all results at once (higher score = better match)
+            count = len(results)
+            scores = np.fromiter(
+                (100000 if city.get('match_type') == 'exact'
+                 else 50000 if city.get('match_type') == 'prefix' else 0
+                 for city in results),
+                dtype=np.float64, count=count
+            )
             
-            # Function to calculate city score based on location
-            def city_score(city):
-                score = 0
-                
-                # Scoring by match type
-                if city.get('match_type') == 'exact':
-                    score += 100000
-                elif city.get('match_type') == 'prefix':
-                    score += 50000
-                
-                # Add fuzzy match score if present
-                if 'fuzzy_score' in city:
-                    # Scale the fuzzy score and apply higher weight
-                    fuzzy_value = city['fuzzy_score'] * 200
-                    
-                    # Extra boost for high fuzzy scores (> 80)
-                    if city['fuzzy_score'] > 80:
-                        fuzzy_value *= 1.5
-                    
-                    score += fuzzy_value
-                
-                # Country match
-                if has_country_sort and city['country'] is not None and city['country'].lower() == user_country.lower():
-                    score += 25000
+            # Add fuzzy match scores, scaled and weighted higher above 80
+            fuzzy_scores = np.fromiter(
+                (city.get('fuzzy_score', 0) for city in results), dtype=np.float64, count=count
+            )
+            scores += fuzzy_scores * 200 * np.where(fuzzy_scores > 80, 1.5, 1.0)
+            
+            # Country match
+            if has_country_sort:
+                scores += 25000 * np.fromiter(
+                    (city['country'] is not None and city['country'].lower() == user_country_lower
+                     for city in results),
+                    dtype=np.float64, count=count
+                )
+            
+            # Distance to user, converted to a score (closer = higher score)
+            if has_geo_sort:
+                lats = np.fromiter((city['lat'] for city in results), dtype=np.float64, count=count)
+                lngs = np.fromiter((city['lng'] for city in results), dtype=np.float64, count=count)
+                distances = _haversine_km_many(user_lat, user_lng, lats, lngs)
+                scores += 50000 / (1 + (distances / 50))
                 
-                # Distance to user
-                if has_geo_sort:
-                    # Calculate distance using Haversine formula
-                    city_lat = city['lat']
-                    city_lng = city['lng']
-                    distance = self._haversine(user_lat, user_lng, city_lat, city_lng)
-                    
-                    # Convert distance to a score (closer = higher score)
-                    distance_score = 50000 / (1 + (distance / 50))
-                    score += distance_score
-                    
-                    # Store distance for reference
+                # Store distance for reference
+                for city, distance in zip(results, distances.tolist()):
                     city['distance_km'] = distance
-                
-                return -score  # Negative for descending sort (higher score = better match)
             
-            # Sort the results by the combined score
-            results.sort(key=city_score)
+            # Sort the results by the combined score, keeping ties in order
+            order = np.argsort(-scores, kind='stable')
+            results = [results[i] for i in order]
         else:
             # Simple sorting by match type if no location info
             def simple_score(city):
@@ -1077,17 +1647,7 @@ class CityRepository(BaseRepository):
         Returns:
             Distance in kilometers between the points
         """
-        # Convert decimal degrees to radians
-        lon1, lat1, lon2, lat2 = map(math.radians, [lon1, lat1, lon2, lat2])
-        
-        # Haversine formula
-        dlon = lon2 - lon1
-        dlat = lat2 - lat1
-        a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
-        c = 2 * math.asin(math.sqrt(a))
-        r = 6371  # Radius of earth in kilometers
-        
-        return c * r
+        return _haversine_km(lat1, lon1, lat2, lon2)
 
     async def search_async(
         self, 
@@ -1165,20 +1725,20 @@ class CityRepository(BaseRepository):
             if query in self.ascii_names:
                 exact_match_ids.extend(self.ascii_names[query])
             
-            # Ensure we only have unique IDs
-            exact_match_ids = list(set(exact_match_ids))
+            # Ensure we only have unique IDs, keeping their order
+            exact_match_ids = list(dict.fromkeys(exact_match_ids))
             
             # Filter by country if needed
             if country and exact_match_ids:
-                country_lower = country.lower()
-                exact_match_ids = [city_id for city_id in exact_match_ids 
-                                 if self.city_index[city_id]['country'].lower() == country_lower]
+                country_ids = self._country_city_ids.get(country.lower(), frozenset())
+                exact_match_ids = [city_id for city_id in exact_match_ids if city_id in country_ids]
             
             # Get prefix matches
             prefix_match_ids = self._get_prefix_matches(query, country)
             
             # Remove exact matches from prefix matches
-            prefix_match_ids = [city_id for city_id in prefix_match_ids if city_id not in exact_match_ids]
+            exact_set = set(exact_match_ids)
+            prefix_match_ids = [city_id for city_id in prefix_match_ids if city_id not in exact_set]
             
             # Prepare initial results (exact + prefix matches)
             initial_results = []
@@ -1200,19 +1760,20 @@ class CityRepository(BaseRepository):
                 initial_results, user_lat, user_lng, user_country
             )
             
-            # Clean up before returning
+            # Clean up the results being returned before returning them
+            initial_result_count = len(initial_results)
+            initial_results = initial_results[:limit]
             for city in initial_results:
                 city.pop('match_type', None)
                 city.pop('fuzzy_score', None)
             
-            initial_result_count = len(initial_results)
             elapsed = time.time() - start_time
             logger.info(f"Initial results ready in {elapsed*1000:.1f}ms: {initial_result_count} matches")
             
             # If we have enough initial results or query is very short, skip fuzzy matching
             if initial_result_count >= limit or len(query) <= 2:
                 logger.info("Skipping fuzzy matching - enough initial results")
-                return initial_results[:limit]
+                return initial_results
             
             # Start fuzzy matching in the background if we need more results
             if callback:
@@ -1223,12 +1784,27 @@ class CityRepository(BaseRepository):
                 ))
             
             # Return the initial results immediately
-            return initial_results[:limit]
+            return initial_results
             
         except Exception as e:
             logger.error(f"Error in async search: {str(e)}", exc_info=True)
             return []
     
+    def _get_fuzzy_scorer(self, query: str) -> Callable[..., float]:
+        """
+        Get the scorer for background fuzzy matching of a query.
+        
+        Args:
+            query: The search query
+            
+        Returns:
+            The configured scorer, or for 'auto' fuzz.ratio (the bit-parallel
+            Indel similarity) for short queries and fuzz.WRatio for longer ones
+        """
+        if self._fuzzy_scorer is not None:
+            return self._fuzzy_scorer
+        return fuzz.ratio if len(query) <= _SHORT_FUZZY_QUERY_LENGTH else fuzz.WRatio
+    
     async def _perform_fuzzy_matching(
         self, query, country, exact_match_ids, prefix_match_ids,
         user_lat, user_lng, user_country, fuzzy_threshold, 
@@ -1242,39 +1818,44 @@ class CityRepository(BaseRepository):
             fuzzy_match_results = []
             
             # Candidates to search - either country-filtered or all names
-            search_names = []
-            
+            # (both built once when loading cities)
             if country:
-                # Get all city names for the specified country
-                country_lower = country.lower()
-                for city_id in self.country_cities.get(country_lower, []):
-                    city = self.city_index[city_id]
-                    search_names.append((city['name'].lower(), city_id))
-                    search_names.append((city['ascii_name'].lower(), city_id))
+                names_only, name_ids = self._names_by_country.get(
+                    country.lower(), ([], self._all_name_ids[:0])
+                )
             else:
-                # Use all names (could be expensive for large datasets)
-                for name, ids in self.city_names.items():
-                    for city_id in ids:
-                        search_names.append((name, city_id))
-                
-                for name, ids in self.ascii_names.items():
-                    for city_id in ids:
-                        search_names.append((name, city_id))
-            
-            # Remove duplicates
-            search_names = list(set(search_names))
-            
-            # Extract just the names for fuzzy matching
-            names_only = [name for name, _ in search_names]
+                names_only = self._all_names
+                name_ids = self._all_name_ids
             
             # Run the CPU-intensive fuzzy matching in a thread pool
             def run_fuzzy_matching():
-                return process.extract(
-                    query, 
-                    names_only, 
-                    limit=min(100, len(names_only)), 
-                    scorer=fuzz.token_set_ratio,
-                    score_cutoff=fuzzy_threshold
+                if not names_only:
+                    return []
+                
+                if USING_RAPIDFUZZ:
+                    # Score every candidate in one multi-threaded C++ call,
+                    # then keep the best 100 at or above the threshold
+                    scores = process.cdist(
+                        [query],
+                        names_only,
+                        scorer=self._get_fuzzy_scorer(query),
+                        score_cutoff=fuzzy_threshold,
+                        workers=-1
+                    )[0]
+                    top = np.flatnonzero(scores >= fuzzy_threshold)
+                    if len(top) > 100:
+                        top = top[np.argpartition(-scores[top], 99)[:100]]
+                    top = top[np.lexsort((top, -scores[top]))]
+                    return [(names_only[i], float(scores[i]), i) for i in top]
+                
+                # fuzzywuzzy only returns the position of a match when the
+                # choices are given as a mapping
+                return process.extractBests(
+                    query,
+                    dict(enumerate(names_only)),
+                    scorer=self._get_fuzzy_scorer(query),
+                    score_cutoff=fuzzy_threshold,
+                    limit=min(100, len(names_only))
                 )
             
             # Run the fuzzy matching in a thread pool to avoid blocking the event loop
@@ -1282,11 +1863,14 @@ class CityRepository(BaseRepository):
             fuzzy_matches = await loop.run_in_executor(None, run_fuzzy_matching)
             
             # Convert fuzzy match results to city IDs with scores
+            matched_ids = set(exact_match_ids)
+            matched_ids.update(prefix_match_ids)
             for matched_name, score, idx in fuzzy_matches:
-                city_id = search_names[idx][1]
-                # Skip cities already in exact or prefix matches
-                if city_id in exact_match_ids or city_id in prefix_match_ids:
+                city_id = int(name_ids[idx])
+                # Skip cities already in exact, prefix or better fuzzy matches
+                if city_id in matched_ids:
                     continue
+                matched_ids.add(city_id)
                 
                 city = self.city_index[city_id].copy()
                 city['fuzzy_score'] = score
@@ -1316,7 +1900,8 @@ class CityRepository(BaseRepository):
                 combined_results, user_lat, user_lng, user_country
             )
             
-            # Clean up before returning
+            # Clean up the results being returned before returning them
+            combined_results = combined_results[:limit]
             for city in combined_results:
                 city.pop('match_type', None)
                 city.pop('fuzzy_score', None)
@@ -1325,7 +1910,7 @@ class CityRepository(BaseRepository):
             logger.info(f"Fuzzy matching completed in {elapsed*1000:.1f}ms: {len(fuzzy_match_results)} fuzzy matches")
             
             # Call the callback with the final results
-            callback(combined_results[:limit])
+            callback(combined_results)
             
         except Exception as e:
             logger.error(f"Error in fuzzy matching: {str(e)}", exc_info=True)
@@ -1337,7 +1922,28 @@ class GeoRepository(BaseRepository):
     Repository for geographic queries such as finding cities by coordinates.
     """
     
-    def find_by_coordinates(self, lat: float, lng: float, radius_km: float = 10) -> List[Dict[str, Any]]:
+    def __init__(self, db_manager: DatabaseManager) -> None:
+        """
+        Initialize the repository with a database manager.
+        
+        Args:
+            db_manager: The database manager to use for database operations
+        """
+        super().__init__(db_manager)
+        
+        # Database capabilities, probed on first use instead of on every query
+        self._sql_math: Optional[bool] = None
+        self._rtree: Optional[bool] = None
+        self._postgis: Optional[bool] = None
+    
+    def find_by_coordinates(
+        self, 
+        lat: float, 
+        lng: float, 
+        radius_km: float = 10,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
         """
         Find cities within a given radius of coordinates.
         
@@ -1345,6 +1951,8 @@ class GeoRepository(BaseRepository):
             lat: Latitude of the center point
             lng: Longitude of the center point
             radius_km: Radius in kilometers
+            limit: Maximum number of cities to return, None for all
+            offset: Number of nearest cities to skip, for pagination
             
         Returns:
             List of cities within the radius, sorted by distance
@@ -1356,129 +1964,259 @@ class GeoRepository(BaseRepository):
             raise ValueError(f"Longitude must be between -180 and 180, got {lng}")
         if radius_km <= 0:
             raise ValueError(f"Radius must be positive, got {radius_km}")
+        if limit is not None and limit < 0:
+            raise ValueError(f"Limit must not be negative, got {limit}")
+        if offset < 0:
+            raise ValueError(f"Offset must not be negative, got {offset}")
             
         # Try to use PostGIS if available for PostgreSQL
-        if self.db_manager.db_type == 'postgresql':
+        if self.db_manager.db_type == 'postgresql' and self._has_postgis():
             try:
                 with self.db_manager.cursor() as cursor:
-                    # Check if PostGIS is available and enabled
-                    cursor.execute("SELECT PostGIS_version()")
-                    postgis_version = cursor.fetchone()
+                    # Use PostGIS for optimal spatial search; ST_DWithin on the
+                    # stored geog column is answered from its GiST index
+                    page_clause, page_params = self._page_clause(limit, offset)
+                    cursor.execute("""
+                        SELECT id, name, ascii_name, country, country_code, state, state_code, lat, lng,
+                               ST_Distance(geog, ST_SetSRID(ST_MakePoint(%s, %s), 4326)::geography) as distance
+                        FROM city_data
+                        WHERE ST_DWithin(geog, ST_SetSRID(ST_MakePoint(%s, %s), 4326)::geography, %s)
+                        ORDER BY distance, id
+                    """ + page_clause, [lng, lat, lng, lat, radius_km * 1000] + page_params)
                     
-                    if postgis_version:
-                        # Use PostGIS for optimal spatial search
-                        cursor.execute("""
-                            SELECT id, name, ascii_name, country, country_code, state, state_code, lat, lng,
-                                   ST_Distance(
-                                       ST_SetSRID(ST_MakePoint(%s, %s), 4326)::geography,
-                                       ST_SetSRID(ST_MakePoint(lng, lat), 4326)::geography
-                                   ) as distance
-                            FROM city_data
-                            WHERE ST_DWithin(
-                                ST_SetSRID(ST_MakePoint(lng, lat), 4326)::geography,
-                                ST_SetSRID(ST_MakePoint(%s, %s), 4326)::geography,
-                                %s
-                            )
-                            ORDER BY distance
-                        """, (lng, lat, lng, lat, radius_km * 1000))
-                        
-                        rows = cursor.fetchall()
-                        columns = ['id', 'name', 'ascii_name', 'country', 'country_code', 
-                                  'state', 'state_code', 'lat', 'lng', 'distance']
-                        return self._rows_to_dicts(rows, columns)
+                    rows = cursor.fetchall()
+                    columns = ['id', 'name', 'ascii_name', 'country', 'country_code', 
+                              'state', 'state_code', 'lat', 'lng', 'distance']
+                    return self._rows_to_dicts(rows, columns)
             except Exception as e:
                 logger.warning(f"PostGIS query failed: {str(e)}. Falling back to Haversine.")
         
         # Fall back to Haversine formula for distance calculation
         # This works for any database type
-        return self._find_by_haversine(lat, lng, radius_km)
+        return self._find_by_haversine(lat, lng, radius_km, limit, offset)
+    
+    def _bounding_box(self, lat: float, lng: float, radius_km: float) -> Tuple[float, float, List[Tuple[float, float]]]:
+        """
+        Compute the latitude/longitude box enclosing a circle on the Earth.
+        
+        Args:
+            lat: Latitude of the center point
+            lng: Longitude of the center point
+            radius_km: Radius in kilometers
+            
+        Returns:
+            Tuple of (min_lat, max_lat, lng_ranges). lng_ranges holds one
+            (min_lng, max_lng) pair, or two if the box crosses the antimeridian.
+        """
+        angular_radius = radius_km / 6371
+        lat_radius = math.degrees(angular_radius)
+        min_lat = lat - lat_radius
+        max_lat = lat + lat_radius
+        
+        # A circle reaching a pole spans every longitude
+        if min_lat <= -90 or max_lat >= 90 or angular_radius >= math.pi / 2:
+            return max(min_lat, -90.0), min(max_lat, 90.0), [(-180.0, 180.0)]
+        
+        # Widest longitude offset of the circle, reached north/south of the center
+        lng_radius = math.degrees(math.asin(math.sin(angular_radius) / math.cos(math.radians(lat))))
+        min_lng = lng - lng_radius
+        max_lng = lng + lng_radius
+        
+        # Split boxes crossing the antimeridian into two ranges
+        if min_lng < -180:
+            return min_lat, max_lat, [(min_lng + 360, 180.0), (-180.0, max_lng)]
+        if max_lng > 180:
+            return min_lat, max_lat, [(min_lng, 180.0), (-180.0, max_lng - 360)]
+        return min_lat, max_lat, [(min_lng, max_lng)]
+    
+    def _has_postgis(self) -> bool:
+        """
+        Check whether the PostGIS extension is installed and city_data has its
+        geog column, caching the result on the repository.
+        
+        Returns:
+            True if PostGIS radius queries can be used
+        """
+        if self._postgis is None:
+            try:
+                with self.db_manager.cursor() as cursor:
+                    cursor.execute("SELECT PostGIS_version()")
+                    self._postgis = cursor.fetchone() is not None
+                    
+                    # Radius queries read the generated geog column, which is
+                    # only added when the schema was set up with PostGIS
+                    if self._postgis:
+                        cursor.execute(
+                            "SELECT 1 FROM information_schema.columns "
+                            "WHERE table_name = 'city_data' AND column_name = 'geog'"
+                        )
+                        self._postgis = cursor.fetchone() is not None
+            except Exception as e:
+                logger.info(f"PostGIS not available: {str(e)}. Using Haversine for radius searches.")
+                self._postgis = False
+        return self._postgis
     
-    def _find_by_haversine(self, lat: float, lng: float, radius_km: float) -> List[Dict[str, Any]]:
+    def _has_rtree(self, cursor: Any) -> bool:
+        """
+        Check whether the SQLite R*Tree index table exists, caching the result
+        on the repository.
+        
+        Args:
+            cursor: Open cursor to run the probe with
+            
+        Returns:
+            True if the city_rtree table exists
+        """
+        if self._rtree is None:
+            if self.db_manager.db_type != 'sqlite':
+                self._rtree = False
+            else:
+                cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='city_rtree'")
+                self._rtree = cursor.fetchone() is not None
+        return self._rtree
+    
+    def _has_sql_math(self, cursor: Any) -> bool:
+        """
+        Check whether the database provides the math functions used to compute
+        Haversine distances in SQL.
+        
+        PostgreSQL always has them; SQLite only when built with
+        SQLITE_ENABLE_MATH_FUNCTIONS (the default since 3.35). The result of
+        the probe is cached on the repository.
+        
+        Args:
+            cursor: Open cursor to run the probe with
+            
+        Returns:
+            True if sin, cos, asin, sqrt, power and radians are available
+        """
+        if self._sql_math is None:
+            if self.db_manager.db_type != 'sqlite':
+                self._sql_math = True
+            else:
+                try:
+                    cursor.execute("SELECT asin(sqrt(power(sin(radians(0)), 2))) + cos(0)")
+                    cursor.fetchone()
+                    self._sql_math = True
+                except Exception:
+                    self._sql_math = False
+        return self._sql_math
+    
+    def _find_by_haversine(
+        self, 
+        lat: float, 
+        lng: float, 
+        radius_km: float,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
         """
         Find cities within a radius using the Haversine formula.
         
+        Candidates are first limited in SQL to the bounding box of the circle,
+        which the R*Tree or the (lat, lng) index can answer. Where the database
+        has math functions the distances are also computed, filtered and sorted
+        in SQL; otherwise the candidates are measured with NumPy.
+        
         Args:
             lat: Latitude of the center point
             lng: Longitude of the center point
             radius_km: Radius in kilometers
+            limit: Maximum number of cities to return, None for all
+            offset: Number of nearest cities to skip, for pagination
             
         Returns:
             List of cities within the radius, sorted by distance
         """
+        min_lat, max_lat, lng_ranges = self._bounding_box(lat, lng, radius_km)
+        param = '?' if self.db_manager.db_type == 'sqlite' else '%s'
+        columns = ['id', 'name', 'ascii_name', 'country', 'country_code', 
+                  'state', 'state_code', 'lat', 'lng']
+        select_list = ", ".join(f"c.{col}" for col in columns)
+        
         try:
             with self.db_manager.cursor() as cursor:
+                params: List[float] = []
+                
                 # For SQLite with R*Tree index, use a more efficient approach
-                if self.db_manager.db_type == 'sqlite':
-                    # Check if the R*Tree index exists
-                    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='city_rtree'")
-                    rtree_exists = cursor.fetchone()
-                    
-                    if rtree_exists:
-                        # Calculate bounding box for the given radius
-                        # Approximate degrees per km (1 degree of latitude ≈ 111.32 km)
-                        # For longitude, 1 degree ≈ 111.32 * cos(latitude) km
-                        lat_radius = radius_km / 111.32
-                        lng_radius = radius_km / (111.32 * abs(math.cos(math.radians(lat))))
-                        
-                        min_lat = lat - lat_radius
-                        max_lat = lat + lat_radius
-                        min_lng = lng - lng_radius
-                        max_lng = lng + lng_radius
-                        
-                        # Use R*Tree to get cities within the bounding box
-                        # R*Tree query checks if the bounding box of the city overlaps with our search box
-                        cursor.execute("""
-                            SELECT c.id, c.name, c.ascii_name, c.country, c.country_code, 
-                                   c.state, c.state_code, c.lat, c.lng
-                            FROM city_data c
-                            INNER JOIN city_rtree r ON c.id = r.id
-                            WHERE r.min_lat <= ? AND r.max_lat >= ? 
-                               AND r.min_lng <= ? AND r.max_lng >= ?
-                        """, (max_lat, min_lat, max_lng, min_lng))
-                        
-                        rows = cursor.fetchall()
-                        columns = ['id', 'name', 'ascii_name', 'country', 'country_code', 
-                                  'state', 'state_code', 'lat', 'lng']
-                        
-                        # Get the cities and filter by Haversine distance (more accurate than bounding box)
-                        cities_with_distance = []
-                        for city in self._rows_to_dicts(rows, columns):
-                            city_lat = city['lat']
-                            city_lng = city['lng']
-                            distance = self._haversine(lat, lng, city_lat, city_lng)
-                            
-                            if distance <= radius_km:
-                                city['distance_km'] = distance
-                                cities_with_distance.append(city)
-                        
-                        # Sort by distance
-                        return sorted(cities_with_distance, key=lambda x: x['distance_km'])
+                if self._has_rtree(cursor):
+                    # R*Tree query checks if the bounding box of the city overlaps with our search box
+                    source = "city_data c INNER JOIN city_rtree r ON c.id = r.id"
+                    conditions = " OR ".join(
+                        ["(r.min_lat <= ? AND r.max_lat >= ? AND r.min_lng <= ? AND r.max_lng >= ?)"] * len(lng_ranges)
+                    )
+                    for min_lng, max_lng in lng_ranges:
+                        params.extend((max_lat, min_lat, max_lng, min_lng))
+                else:
+                    # Fallback for when R*Tree is not available or for other
+                    # database types; the (lat, lng) index serves the range
+                    source = "city_data c"
+                    lng_conditions = " OR ".join(
+                        [f"c.lng BETWEEN {param} AND {param}"] * len(lng_ranges)
+                    )
+                    conditions = f"c.lat BETWEEN {param} AND {param} AND ({lng_conditions})"
+                    params.extend((min_lat, max_lat))
+                    for min_lng, max_lng in lng_ranges:
+                        params.extend((min_lng, max_lng))
                 
-                # Fallback method for when R*Tree is not available or for other database types
-                # Get all city data
-                cursor.execute("""
-                    SELECT id, name, ascii_name, country, country_code, state, state_code, lat, lng
-                    FROM city_data
-                """)
+                if self._has_sql_math(cursor):
+                    # Haversine in SQL, with a clamped to 1 so rounding cannot
+                    # take asin out of its domain for antipodal points
+                    least = 'min' if self.db_manager.db_type == 'sqlite' else 'LEAST'
+                    distance = (
+                        f"2 * 6371 * asin(sqrt({least}(1.0, "
+                        f"power(sin((radians(c.lat) - {param}) / 2), 2) + "
+                        f"{param} * cos(radians(c.lat)) * power(sin((radians(c.lng) - {param}) / 2), 2))))"
+                    )
+                    lat_rad = math.radians(lat)
+                    page_clause, page_params = self._page_clause(limit, offset)
+                    cursor.execute(f"""
+                        SELECT {", ".join(columns)}, distance_km
+                        FROM (
+                            SELECT {select_list}, {distance} AS distance_km
+                            FROM {source}
+                            WHERE {conditions}
+                        ) AS candidates
+                        WHERE distance_km <= {param}
+                        ORDER BY distance_km, id{page_clause}
+                    """, [lat_rad, math.cos(lat_rad), math.radians(lng)] + params + [radius_km] + page_params)
+                    return self._rows_to_dicts(cursor.fetchall(), columns + ['distance_km'])
                 
-                rows = cursor.fetchall()
-                columns = ['id', 'name', 'ascii_name', 'country', 'country_code', 
-                          'state', 'state_code', 'lat', 'lng']
-                all_cities = self._rows_to_dicts(rows, columns)
+                cursor.execute(f"SELECT {select_list} FROM {source} WHERE {conditions}", params)
                 
-                # Calculate distances using Haversine formula
-                cities_with_distance = []
-                for city in all_cities:
-                    city_lat = city['lat']
-                    city_lng = city['lng']
-                    distance = self._haversine(lat, lng, city_lat, city_lng)
-                    
-                    if distance <= radius_km:
-                        city['distance_km'] = distance
-                        cities_with_distance.append(city)
+                # Filter the candidates by Haversine distance (more accurate than
+                # bounding box) a batch at a time, so only the rows inside the
+                # circle are kept and turned into dictionaries
+                lat_index, lng_index = columns.index('lat'), columns.index('lng')
+                kept_rows: List[Tuple] = []
+                kept_distances: List[np.ndarray] = []
+                while True:
+                    batch = cursor.fetchmany(_FETCH_BATCH_SIZE)
+                    if not batch:
+                        break
+                    count = len(batch)
+                    distances = self._haversine_many(
+                        lat, lng,
+                        np.fromiter((row[lat_index] for row in batch), dtype=np.float64, count=count),
+                        np.fromiter((row[lng_index] for row in batch), dtype=np.float64, count=count)
+                    )
+                    within = np.flatnonzero(distances <= radius_km)
+                    kept_rows.extend(batch[i] for i in within)
+                    kept_distances.append(distances[within])
+                if not kept_rows:
+                    return []
                 
-                # Sort by distance
-                return sorted(cities_with_distance, key=lambda x: x['distance_km'])
+                # Sort by distance then id, as the SQL path does, so pages are
+                # stable; keep only the requested page
+                distances = np.concatenate(kept_distances)
+                id_index = columns.index('id')
+                ids = np.fromiter((row[id_index] for row in kept_rows), dtype=np.int64, count=len(kept_rows))
+                order = np.lexsort((ids, distances))
+                order = order[offset:None if limit is None else offset + limit]
+                cities_with_distance = self._rows_to_dicts([kept_rows[i] for i in order], columns)
+                for city, distance_km in zip(cities_with_distance, distances[order].tolist()):
+                    city['distance_km'] = distance_km
+                return cities_with_distance
         except Exception as e:
             logger.error(f"Error getting cities by coordinates: {str(e)}")
             return []
@@ -1496,83 +2234,129 @@ class GeoRepository(BaseRepository):
         Returns:
             Distance in kilometers
         """
-        # Convert decimal degrees to radians
-        lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
-        
-        # Haversine formula
-        dlat = lat2 - lat1
-        dlon = lon2 - lon1
-        a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
-        c = 2 * math.asin(math.sqrt(a))
-        r = 6371  # Radius of Earth in kilometers
+        return _haversine_km(lat1, lon1, lat2, lon2)
+    
+    def _haversine_many(self, lat: float, lng: float, lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+        """
+        Calculate the great-circle distances from one point to many points.
         
-        return c * r
+        Args:
+            lat: Latitude of the origin in degrees
+            lng: Longitude of the origin in degrees
+            lats: Latitudes of the destinations in degrees
+            lngs: Longitudes of the destinations in degrees
+            
+        Returns:
+            Array of distances in kilometers, aligned with lats and lngs
+        """
+        return _haversine_km_many(lat, lng, lats, lngs)
 
 class RegionRepository(BaseRepository):
     """
     Repository for hierarchical region queries (countries, states, cities in states).
     """
     
-    @lru_cache(maxsize=1)
-    def get_countries(self) -> List[str]:
+    def __init__(self, db_manager: DatabaseManager) -> None:
+        """
+        Initialize the repository with a database manager.
+        
+        Args:
+            db_manager: The database manager to use for database operations
+        """
+        super().__init__(db_manager)
+        
+        # Countries and their states, loaded together on first use
+        self._countries: Optional[Tuple[str, ...]] = None
+        self._states_by_country: Dict[str, Tuple[str, ...]] = {}
+    
+    def clear_caches(self) -> None:
+        """
+        Drop all cached query results and the loaded country/state lists.
+        """
+        super().clear_caches()
+        self._countries = None
+        self._states_by_country = {}
+    
+    def _warmup(self) -> None:
         """
-        Get a list of all countries.
+        Load every country and its states with a single query.
+        
+        There are only a few hundred countries and a few thousand states, so
+        holding them in memory lets get_countries and get_states answer
+        without a database round trip.
+        """
+        with self.db_manager.cursor() as cursor:
+            cursor.execute("SELECT DISTINCT country, state FROM city_data ORDER BY country, state")
+            rows = cursor.fetchall()
+        
+        countries: List[str] = []
+        states_by_country: Dict[str, List[str]] = {}
+        for row in rows:
+            # PostgreSQL cursors return rows as dicts
+            country, state = (row['country'], row['state']) if isinstance(row, dict) else row
+            if not countries or countries[-1] != country:
+                countries.append(country)
+            if country is not None and state:
+                states_by_country.setdefault(country.lower(), []).append(state)
+        
+        self._states_by_country = {
+            country: tuple(states) for country, states in states_by_country.items()
+        }
+        self._countries = tuple(countries)
+    
+    def get_countries(self) -> Tuple[str, ...]:
+        """
+        Get all countries.
         
         Returns:
-            List of country names, sorted alphabetically
+            Tuple of country names, sorted alphabetically
         """
         try:
-            with self.db_manager.cursor() as cursor:
-                cursor.execute("SELECT DISTINCT country FROM city_data ORDER BY country")
-                
-                return [row[0] for row in cursor.fetchall()]
+            if self._countries is None:
+                self._warmup()
+            return self._countries
                 
         except Exception as e:
             logger.error(f"Error getting countries: {str(e)}")
-            return []
+            return ()
     
-    @lru_cache(maxsize=100)
-    def get_states(self, country: str) -> List[str]:
+    def get_states(self, country: str) -> Tuple[str, ...]:
         """
-        Get a list of states in a country.
+        Get the states in a country.
         
         Args:
             country: Country name
             
         Returns:
-            List of state names, sorted alphabetically
+            Tuple of state names, sorted alphabetically
         """
         try:
-            with self.db_manager.cursor() as cursor:
-                if self.db_manager.db_type == 'sqlite':
-                    cursor.execute("""
-                        SELECT DISTINCT state 
-                        FROM city_data 
-                        WHERE LOWER(country) = LOWER(?) AND state != ''
-                        ORDER BY state
-                    """, (country,))
-                else:  # PostgreSQL
-                    cursor.execute("""
-                        SELECT DISTINCT state 
-                        FROM city_data 
-                        WHERE LOWER(country) = LOWER(%s) AND state != ''
-                        ORDER BY state
-                    """, (country,))
-                
-                return [row[0] for row in cursor.fetchall()]
+            if self._countries is None:
+                self._warmup()
+            return self._states_by_country.get(country.lower(), ())
                 
         except Exception as e:
             logger.error(f"Error getting states for country {country}: {str(e)}")
-            return []
+            return ()
     
-    @lru_cache(maxsize=500)
-    def get_cities_in_state(self, state: str, country: str) -> List[Dict[str, Any]]:
+    @_cached(maxsize=500, key=lambda state, country, limit=None, offset=0: (
+        state.lower(), country.lower(), limit, offset
+    ))
+    def get_cities_in_state(
+        self, 
+        state: str, 
+        country: str,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
         """
-        Get all cities in a state.
+        Get the cities in a state.
         
         Args:
             state: State name
             country: Country name
+            limit: Maximum number of cities to return, None for all
+            offset: Number of cities to skip, for pagination
             
         Returns:
             List of cities in the state, sorted by name
@@ -1581,21 +2365,22 @@ class RegionRepository(BaseRepository):
             # Enforce case-insensitive matching
             state_lower = state.lower()
             country_lower = country.lower()
+            page_clause, page_params = self._page_clause(limit, offset)
             
             if self.db_manager.db_type == 'sqlite':
                 cursor.execute("""
                     SELECT id, name, ascii_name, country, country_code, state, state_code, lat, lng
                     FROM city_data
                     WHERE LOWER(state) = ? AND LOWER(country) = ?
-                    ORDER BY name
-                """, (state_lower, country_lower))
+                    ORDER BY name, id
+                """ + page_clause, [state_lower, country_lower] + page_params)
             else:  # PostgreSQL
                 cursor.execute("""
                     SELECT id, name, ascii_name, country, country_code, state, state_code, lat, lng
                     FROM city_data
                     WHERE LOWER(state) = %s AND LOWER(country) = %s
-                    ORDER BY name
-                """, (state_lower, country_lower))
+                    ORDER BY name, id
+                """ + page_clause, [state_lower, country_lower] + page_params)
             
             rows = cursor.fetchall()
             columns = ['id', 'name', 'ascii_name', 'country', 'country_code', 
@@ -12,6 +12,22 @@ from GeoDash.config.manager import get_config
 # Get a logger for this module
 logger = get_logger(__name__)
 
+# Secondary B-tree indexes on the city_data table
+CITY_INDEXES: List[Dict[str, Any]] = [
+    {'name': 'idx_city_name', 'columns': ['ascii_name']},
+    {'name': 'idx_city_country', 'columns': ['country']},
+    {'name': 'idx_city_state', 'columns': ['state']},
+    {'name': 'idx_city_coords', 'columns': ['lat', 'lng']},
+    # Expression index for the case-insensitive country/state lookups, which
+    # filter on LOWER(...) and cannot use idx_city_country or idx_city_state;
+    # name and id follow so cities in a state are read already in result order
+    {'name': 'idx_city_country_state_lower', 'columns': ['LOWER(country)', 'LOWER(state)', 'name', 'id']}
+]
+
+# PostgreSQL indexes built with custom SQL (PostGIS GiST, full-text GIN) that
+# bulk loads drop and later restore from their pg_indexes definitions
+POSTGRESQL_CUSTOM_INDEXES: Tuple[str, ...] = ('idx_city_geog', 'idx_city_search_vector')
+
 class SchemaManager:
     """
     A class to manage the database schema for GeoDash.
@@ -67,6 +83,13 @@ class SchemaManager:
                     logger.info("R*Tree spatial indexing is disabled in configuration")
         else:
             logger.info(f"Table {self.city_table_name} already exists.")
+            # Pick up B-tree indexes added since the database was created
+            for index in CITY_INDEXES:
+                self.db_manager.create_index(
+                    index_name=index['name'],
+                    table_name=self.city_table_name,
+                    columns=index['columns']
+                )
             # Only ensure R*Tree is populated if the feature is enabled
             if self.db_manager.db_type == 'sqlite' and self.config.get("database.sqlite.rtree", True):
                 self._ensure_rtree_populated()
@@ -95,11 +118,11 @@ class SchemaManager:
                     rtree_exists = cursor.fetchone()
                     
                     # Check if we have city data
-                    cursor.execute("SELECT COUNT(*) FROM city_data")
-                    city_count = cursor.fetchone()[0]
+                    cursor.execute("SELECT 1 FROM city_data LIMIT 1")
+                    has_cities = cursor.fetchone() is not None
                     
-                    if not rtree_exists and city_count > 0:
-                        logger.info(f"Creating R*Tree spatial index for {city_count} existing cities")
+                    if not rtree_exists and has_cities:
+                        logger.info("Creating R*Tree spatial index for existing cities")
                         
                         # Create the R*Tree table
                         cursor.execute(f'''
@@ -141,7 +164,7 @@ class SchemaManager:
                         SELECT id, lat, lat, lng, lng FROM {self.city_table_name}
                         ''')
                         
-                        logger.info(f"Successfully created and populated R*Tree index for {city_count} cities")
+                        logger.info(f"Successfully created and populated R*Tree index for {cursor.rowcount} cities")
                         return
                     
                     elif rtree_exists:
@@ -240,14 +263,7 @@ class SchemaManager:
         Create indexes on the city_data table for better query performance.
         """
         # Create basic indexes for all database types
-        indexes = [
-            {'name': 'idx_city_name', 'columns': ['ascii_name']},
-            {'name': 'idx_city_country', 'columns': ['country']},
-            {'name': 'idx_city_state', 'columns': ['state']},
-            {'name': 'idx_city_coords', 'columns': ['lat', 'lng']}
-        ]
-        
-        for index in indexes:
+        for index in CITY_INDEXES:
             self.db_manager.create_index(
                 index_name=index['name'],
                 table_name=self.city_table_name,
@@ -331,10 +347,25 @@ class SchemaManager:
                                 logger.warning("PostGIS spatial index will not be created")
                                 return
                         
+                        # Store the point as a generated geography column so it is
+                        # computed at insert time instead of by a separate UPDATE
+                        # pass, and radius queries can use it without casting
+                        cursor.execute(f'''
+                        ALTER TABLE {self.city_table_name}
+                        ADD COLUMN IF NOT EXISTS geog geography(Point, 4326)
+                        GENERATED ALWAYS AS (ST_SetSRID(ST_MakePoint(lng, lat), 4326)::geography) STORED
+                        ''')
+                        
+                        # Older databases carry a geometry index (and column) that
+                        # geography queries cannot use; drop them so inserts stop
+                        # maintaining them
+                        cursor.execute("DROP INDEX IF EXISTS idx_city_geography")
+                        cursor.execute(f"ALTER TABLE {self.city_table_name} DROP COLUMN IF EXISTS geom")
+                        
                         # Create a GiST index for fast spatial queries
                         cursor.execute(f'''
-                        CREATE INDEX IF NOT EXISTS idx_city_geography ON {self.city_table_name}
-                        USING gist (ST_SetSRID(ST_MakePoint(lng, lat), 4326))
+                        CREATE INDEX IF NOT EXISTS idx_city_geog ON {self.city_table_name}
+                        USING gist (geog)
                         ''')
                         
                         logger.info("Created PostgreSQL spatial index using PostGIS")
@@ -445,49 +476,43 @@ class SchemaManager:
         elif self.db_manager.db_type == 'postgresql' and self.config.is_feature_enabled('enable_advanced_db'):
             try:
                 with self.db_manager.cursor() as cursor:
-                    # Add tsvector columns if they don't exist
+                    # Store the search vector as a generated column, like geog, so
+                    # it is computed during the insert itself rather than by a
+                    # per-row trigger or a separate UPDATE pass over the table
                     cursor.execute(f'''
-                    DO $$
-                    BEGIN
-                        IF NOT EXISTS (
-                            SELECT 1 FROM information_schema.columns 
-                            WHERE table_name = '{self.city_table_name}' AND column_name = 'search_vector'
-                        ) THEN
-                            ALTER TABLE {self.city_table_name} ADD COLUMN search_vector tsvector;
-                            
-                            -- Populate search vector
-                            UPDATE {self.city_table_name} SET search_vector = 
-                                setweight(to_tsvector('english', coalesce(name, '')), 'A') ||
-                                setweight(to_tsvector('english', coalesce(ascii_name, '')), 'A') ||
-                                setweight(to_tsvector('english', coalesce(state, '')), 'B') ||
-                                setweight(to_tsvector('english', coalesce(country, '')), 'C');
-                                
-                            -- Create GIN index
-                            CREATE INDEX IF NOT EXISTS idx_city_search_vector ON {self.city_table_name} USING GIN(search_vector);
-                            
-                            -- Create trigger for updates
-                            CREATE OR REPLACE FUNCTION city_search_vector_update() RETURNS trigger AS $$
-                            BEGIN
-                                NEW.search_vector := 
-                                    setweight(to_tsvector('english', coalesce(NEW.name, '')), 'A') ||
-                                    setweight(to_tsvector('english', coalesce(NEW.ascii_name, '')), 'A') ||
-                                    setweight(to_tsvector('english', coalesce(NEW.state, '')), 'B') ||
-                                    setweight(to_tsvector('english', coalesce(NEW.country, '')), 'C');
-                                RETURN NEW;
-                            END
-                            $$ LANGUAGE plpgsql;
-                            
-                            CREATE TRIGGER city_search_update
-                            BEFORE INSERT OR UPDATE ON {self.city_table_name}
-                            FOR EACH ROW EXECUTE FUNCTION city_search_vector_update();
-                        END IF;
-                    END $$;
+                    ALTER TABLE {self.city_table_name}
+                    ADD COLUMN IF NOT EXISTS search_vector tsvector
+                    GENERATED ALWAYS AS (
+                        setweight(to_tsvector('english', coalesce(name, '')), 'A') ||
+                        setweight(to_tsvector('english', coalesce(ascii_name, '')), 'A') ||
+                        setweight(to_tsvector('english', coalesce(state, '')), 'B') ||
+                        setweight(to_tsvector('english', coalesce(country, '')), 'C')
+                    ) STORED
+                    ''')
+                    
+                    # Create GIN index
+                    cursor.execute(f'''
+                    CREATE INDEX IF NOT EXISTS idx_city_search_vector ON {self.city_table_name}
+                    USING GIN(search_vector)
                     ''')
                     
                     logger.info("Created PostgreSQL full-text search index with tsvector and GIN")
             except Exception as e:
                 logger.warning(f"Error creating PostgreSQL search optimizations: {str(e)}")
     
+    def has_city_data(self) -> bool:
+        """
+        Check whether the city_data table contains any rows.
+        
+        Unlike COUNT(*), this stops at the first row instead of scanning the table.
+        
+        Returns:
+            True if at least one city is stored, False otherwise
+        """
+        with self.db_manager.cursor() as cursor:
+            cursor.execute(f"SELECT 1 FROM {self.city_table_name} LIMIT 1")
+            return cursor.fetchone() is not None
+    
     def get_table_info(self) -> Dict[str, Any]:
         """
         Get information about the city_data table.
@@ -5,7 +5,7 @@ This module provides service methods for city data operations that can be used
 by both the CLI and API layers.
 """
 
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Tuple, Union
 
 from GeoDash.data import CityData
 from GeoDash.utils.logging import get_logger
@@ -81,7 +81,9 @@ class CityService:
         self, 
         lat: float, 
         lng: float, 
-        radius_km: float = 10
+        radius_km: float = 10,
+        limit: Optional[int] = None,
+        offset: int = 0
     ) -> List[Dict[str, Any]]:
         """
         Find cities within a given radius from the specified coordinates.
@@ -90,6 +92,8 @@ class CityService:
             lat: Latitude of the center point
             lng: Longitude of the center point
             radius_km: Search radius in kilometers (default: 10)
+            limit: Maximum number of cities to return (default: all)
+            offset: Number of nearest cities to skip, for pagination
             
         Returns:
             List of cities within the radius, ordered by distance
@@ -98,45 +102,60 @@ class CityService:
         return self.city_data.get_cities_by_coordinates(
             lat=lat,
             lng=lng,
-            radius_km=radius_km
+            radius_km=radius_km,
+            limit=limit,
+            offset=offset
         )
     
-    def get_countries(self) -> List[str]:
+    def get_countries(self) -> Tuple[str, ...]:
         """
-        Get a list of all countries.
+        Get all countries.
         
         Returns:
-            List of country names, sorted alphabetically
+            Tuple of country names, sorted alphabetically
         """
         logger.debug("Getting list of all countries")
         return self.city_data.get_countries()
     
-    def get_states(self, country: str) -> List[str]:
+    def get_states(self, country: str) -> Tuple[str, ...]:
         """
-        Get a list of states in a country.
+        Get the states in a country.
         
         Args:
             country: Country name
             
         Returns:
-            List of state names, sorted alphabetically
+            Tuple of state names, sorted alphabetically
         """
         logger.debug(f"Getting states in country: {country}")
         return self.city_data.get_states(country=country)
     
-    def get_cities_in_state(self, state: str, country: str) -> List[Dict[str, Any]]:
+    def get_cities_in_state(
+        self, 
+        state: str, 
+        country: str,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
         """
         Get a list of cities in a state.
         
         Args:
             state: State name
             country: Country name
+            limit: Maximum number of cities to return (default: all)
+            offset: Number of cities to skip, for pagination
             
         Returns:
             List of cities in the state, sorted by name
         """
         logger.debug(f"Getting cities in state: {state}, country: {country}")
-        return self.city_data.get_cities_in_state(state=state, country=country)
+        return self.city_data.get_cities_in_state(
+            state=state,
+            country=country,
+            limit=limit,
+            offset=offset
+        )
     
     def get_table_info(self) -> Dict[str, Any]:
         """
@@ -148,13 +167,14 @@ class CityService:
         logger.debug("Getting city_data table information")
         return self.city_data.get_table_info()
     
-    def import_city_data(self, csv_path: Optional[str] = None, batch_size: int = 5000) -> bool:
+    def import_city_data(self, csv_path: Optional[str] = None, batch_size: Optional[int] = None) -> bool:
         """
         Import city data from a CSV file.
         
         Args:
             csv_path: Path to the CSV file to import. If None, attempts to find a default file.
-            batch_size: Number of records to import at once.
+            batch_size: Number of records to import at once. If None, uses the
+                configured data.batch_size.
             
         Returns:
             True if the import was successful, False otherwise.
@@ -132,12 +132,32 @@ setup(
     },
     python_requires=">=3.6",
     install_requires=[
+        "numpy>=1.20.0",
         "pandas>=1.3.0",
         "flask>=2.0.0",
         "psycopg2-binary>=2.9.0",
         "click>=8.0.0",
         "PyYAML>=6.0",
     ],
+    extras_require={
+        # Faster CSV import, fuzzy search and autocomplete; each is optional
+        # and GeoDash falls back to slower pure-Python paths without it
+        "fast": [
+            "pyarrow>=7.0.0",
+            "rapidfuzz>=2.0.0",
+            "pygtrie>=2.4.0",
+            "charset-normalizer>=2.0.0",
+        ],
+        # JIT-compiled Haversine kernels for radius searches
+        "numba": [
+            "numba>=0.56.0",
+        ],
+        # Arrow-native bulk ingest into PostgreSQL
+        "adbc": [
+            "pyarrow>=7.0.0",
+            "adbc-driver-postgresql>=0.8.0",
+        ],
+    },
     entry_points={
         "console_scripts": [
             "GeoDash=GeoDash.__main__:main",
@@ -10,6 +10,7 @@ import unittest
 import shutil
 
 from GeoDash.config import get_config, deep_merge
+from GeoDash.config.schema import FUZZY_SCORERS, validate_search_config
 
 
 class TestConfig(unittest.TestCase):
@@ -133,6 +134,19 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(merged["logging"]["level"], "info")
         self.assertEqual(merged["logging"]["format"], "json")
 
+    def test_fuzzy_scorer_validation(self):
+        """Test that the fuzzy scorer is checked against the allowed values."""
+        # The default scorer picks one per query
+        self.assertEqual(self.config.get_fuzzy_settings()["scorer"], "auto")
+        
+        for scorer in FUZZY_SCORERS:
+            self.assertEqual(validate_search_config({"fuzzy": {"scorer": scorer}}), [])
+        
+        # Scorer names are case-sensitive, like the rapidfuzz functions
+        errors = validate_search_config({"fuzzy": {"scorer": "wratio"}})
+        self.assertEqual(len(errors), 1)
+        self.assertIn("wratio", errors[0])
+
 
 if __name__ == "__main__":
     unittest.main() 
\ No newline at end of file
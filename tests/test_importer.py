@@ -0,0 +1,349 @@
+"""
+Tests for the GeoDash city data download and import.
+"""
+
+import csv
+import email.message
+import gzip
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import urllib.error
+from unittest import mock
+
+import pandas as pd
+
+from GeoDash.data import importer
+from GeoDash.data.database import DatabaseManager
+from GeoDash.data.importer import CityDataImporter, _to_copy_csv, download_city_data
+from GeoDash.data.schema import SchemaManager
+from GeoDash.exceptions import DataImportError
+
+URL = "https://example.com/cities.csv"
+CSV_V1 = b"id,name,country_code,latitude,longitude\n1,Alpha,TL,10.0,20.0\n2,Bravo,TL,10.1,20.1\n"
+CSV_V2 = b"id,name,country_code,latitude,longitude\n1,Alpha,TL,10.0,20.0\n3,Charlie,TL,10.2,20.2\n"
+
+
+class FakeResponse(io.BytesIO):
+    """Minimal stand-in for the response object returned by urlopen."""
+
+    def __init__(self, body, status=200, headers=None):
+        super().__init__(body)
+        self.status = status
+        self.headers = email.message.Message()
+        for name, value in (headers or {}).items():
+            self.headers[name] = value
+
+    def getcode(self):
+        return self.status
+
+
+class FakeServer:
+    """Replays canned responses to urlopen and records the request headers."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def urlopen(self, request):
+        self.requests.append({name.lower(): value for name, value in request.header_items()})
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+class TestDownloadCityData(unittest.TestCase):
+    """Test cases for HTTP caching of the city data download."""
+
+    def setUp(self):
+        """Point the data directory at an empty temporary directory."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.temp_dir, 'cities.csv')
+        env = mock.patch.dict(os.environ, {'GEODASH_DATA_DIR': self.temp_dir})
+        env.start()
+        self.addCleanup(env.stop)
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        shutil.rmtree(self.temp_dir)
+
+    def download(self, server):
+        """Run a forced download against a fake server."""
+        with mock.patch('GeoDash.data.importer.urllib.request.urlopen', server.urlopen):
+            return download_city_data(force=True, url=URL)
+
+    def read_csv(self):
+        with open(self.csv_path, 'rb') as f:
+            return f.read()
+
+    def test_not_modified(self):
+        """Test that a 304 response keeps the current file."""
+        self.download(FakeServer(FakeResponse(CSV_V1, headers={
+            'ETag': '"v1"', 'Last-Modified': 'Mon, 05 Oct 2026 10:00:00 GMT'
+        })))
+        with open(self.csv_path + '.etag', encoding='utf-8') as f:
+            self.assertEqual(json.load(f)['etag'], '"v1"')
+
+        server = FakeServer(urllib.error.HTTPError(URL, 304, 'Not Modified', email.message.Message(), None))
+        self.assertEqual(self.download(server), self.csv_path)
+
+        # The stored validators are sent back and the file is left alone
+        self.assertEqual(server.requests[0]['if-none-match'], '"v1"')
+        self.assertEqual(server.requests[0]['if-modified-since'], 'Mon, 05 Oct 2026 10:00:00 GMT')
+        self.assertEqual(self.read_csv(), CSV_V1)
+        self.assertFalse(os.path.exists(self.csv_path + '.part'))
+
+    def test_local_changes_skip_conditional_request(self):
+        """Test that a file edited since the download is fetched unconditionally."""
+        self.download(FakeServer(FakeResponse(CSV_V1, headers={'ETag': '"v1"'})))
+        with open(self.csv_path, 'ab') as f:
+            f.write(b"9,Edited,TL,0.0,0.0\n")
+
+        server = FakeServer(FakeResponse(CSV_V1, headers={'ETag': '"v1"'}))
+        self.download(server)
+
+        self.assertNotIn('if-none-match', server.requests[0])
+        self.assertEqual(self.read_csv(), CSV_V1)
+
+    def test_gzip_body(self):
+        """Test that a gzip-encoded response is stored decompressed."""
+        server = FakeServer(FakeResponse(gzip.compress(CSV_V1), headers={
+            'ETag': '"v1"', 'Content-Encoding': 'gzip'
+        }))
+        self.download(server)
+
+        self.assertEqual(server.requests[0]['accept-encoding'], 'gzip')
+        self.assertEqual(self.read_csv(), CSV_V1)
+        self.assertFalse(os.path.exists(self.csv_path + '.part'))
+        self.assertFalse(os.path.exists(self.csv_path + '.part.etag'))
+
+    def write_partial(self, body, etag):
+        """Leave a partial download as an interrupted transfer would."""
+        with open(self.csv_path + '.part', 'wb') as f:
+            f.write(body)
+        with open(self.csv_path + '.part.etag', 'w', encoding='utf-8') as f:
+            json.dump({'url': URL, 'etag': etag, 'last_modified': None}, f)
+
+    def test_resume_partial_download(self):
+        """Test that a 206 response is appended to the partial file."""
+        split = 30
+        self.write_partial(CSV_V1[:split], '"v1"')
+
+        rest = CSV_V1[split:]
+        server = FakeServer(FakeResponse(rest, status=206, headers={
+            'ETag': '"v1"', 'Content-Length': str(len(rest))
+        }))
+        self.download(server)
+
+        # Ranges only apply to the unencoded body
+        self.assertEqual(server.requests[0]['range'], f"bytes={split}-")
+        self.assertEqual(server.requests[0]['if-range'], '"v1"')
+        self.assertEqual(server.requests[0]['accept-encoding'], 'identity')
+        self.assertEqual(self.read_csv(), CSV_V1)
+        self.assertFalse(os.path.exists(self.csv_path + '.part'))
+        self.assertFalse(os.path.exists(self.csv_path + '.part.etag'))
+
+    def test_resume_etag_mismatch(self):
+        """Test that a changed resource replaces the partial file instead of extending it."""
+        self.write_partial(CSV_V1[:30], '"v1"')
+
+        # The If-Range validator no longer matches, so the server sends it all
+        server = FakeServer(FakeResponse(CSV_V2, headers={
+            'ETag': '"v2"', 'Content-Length': str(len(CSV_V2))
+        }))
+        self.download(server)
+
+        self.assertEqual(server.requests[0]['if-range'], '"v1"')
+        self.assertEqual(self.read_csv(), CSV_V2)
+        with open(self.csv_path + '.etag', encoding='utf-8') as f:
+            self.assertEqual(json.load(f)['etag'], '"v2"')
+
+    def test_truncated_transfer_resumes_on_retry(self):
+        """Test that a body cut short is kept and resumed by the next attempt."""
+        split = 30
+        server = FakeServer(
+            FakeResponse(CSV_V1[:split], headers={'ETag': '"v1"', 'Content-Length': str(len(CSV_V1))}),
+            FakeResponse(CSV_V1[split:], status=206, headers={
+                'ETag': '"v1"', 'Content-Length': str(len(CSV_V1) - split)
+            })
+        )
+        with mock.patch('GeoDash.data.importer.time.sleep') as sleep:
+            self.download(server)
+
+        sleep.assert_called_once()
+        self.assertEqual(server.requests[1]['range'], f"bytes={split}-")
+        self.assertEqual(self.read_csv(), CSV_V1)
+
+
+class TestCityDataImporter(unittest.TestCase):
+    """Test cases for importing city data CSV files."""
+
+    def setUp(self):
+        """Create an empty SQLite database."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_manager = DatabaseManager(f"sqlite:///{os.path.join(self.temp_dir, 'cities.db')}")
+        SchemaManager(self.db_manager).create_schema()
+        self.importer = CityDataImporter(self.db_manager)
+
+    def tearDown(self):
+        """Remove the temporary database."""
+        self.db_manager.close()
+        shutil.rmtree(self.temp_dir)
+
+    def import_csv(self, name, body):
+        """Write a CSV file and import it."""
+        csv_path = os.path.join(self.temp_dir, name)
+        with open(csv_path, 'wb') as f:
+            f.write(body)
+        return self.importer.import_from_csv(csv_path, download_if_missing=False)
+
+    def fetch(self, sql):
+        with self.db_manager.cursor() as cursor:
+            cursor.execute(sql)
+            return [tuple(row) for row in cursor.fetchall()]
+
+    def test_reimport_updates_existing_rows(self):
+        """Test that re-importing a changed CSV refreshes rows with the same ID."""
+        self.import_csv('v1.csv', CSV_V1)
+        self.import_csv('v2.csv', CSV_V2.replace(b"1,Alpha,TL,10.0", b"1,Alpha Prime,TL,11.0"))
+
+        self.assertEqual(
+            self.fetch("SELECT id, name, lat FROM city_data ORDER BY id"),
+            [(1, 'Alpha Prime', 11.0), (2, 'Bravo', 10.1), (3, 'Charlie', 10.2)]
+        )
+
+    def test_duplicate_ids_keep_last_row(self):
+        """Test that the last row wins when a CSV repeats an ID."""
+        self.import_csv('dup.csv', CSV_V1 + b"1,Alpha Again,TL,12.0,20.0\n")
+
+        self.assertEqual(
+            self.fetch("SELECT id, name FROM city_data ORDER BY id"),
+            [(1, 'Alpha Again'), (2, 'Bravo')]
+        )
+
+    def test_missing_country_codes_filled_from_coded_rows(self):
+        """Test that a missing country code is taken from another row of the same country."""
+        self.import_csv('codes.csv', (
+            b"id,name,country_code,country_name,latitude,longitude\n"
+            b"1,Windhoek,NA,Namibia,-22.6,17.1\n"
+            b"2,Walvis Bay,,Namibia,-22.9,14.5\n"
+            b"3,Nowhere,,Atlantis,0.0,0.0\n"
+        ))
+
+        # Atlantis never appears with a code, so its city is skipped rather
+        # than given a code guessed from the name
+        self.assertEqual(
+            self.fetch("SELECT id, country_code, country FROM city_data ORDER BY id"),
+            [(1, 'NA', 'Namibia'), (2, 'NA', 'Namibia')]
+        )
+
+    def test_country_code_lookup_spans_chunks(self):
+        """Test that codes learned from one chunk fill rows of later chunks."""
+        first = pd.DataFrame({'country_name': ['Namibia'], 'country_code': ['NA']})
+        later = pd.DataFrame({'country_name': ['Namibia', 'Atlantis'], 'country_code': [None, None]})
+        self.importer._fill_country_codes(first)
+        self.importer._fill_country_codes(later)
+
+        self.assertEqual(later['country_code'].iloc[0], 'NA')
+        self.assertTrue(pd.isna(later['country_code'].iloc[1]))
+
+    def test_copy_csv_keeps_empty_strings(self):
+        """Test that COPY reads empty strings back as empty strings and missing values as NULL."""
+        self.assertIn("NULL '\\N'", self.importer._pg_copy_sql)
+        self.assertIn("NULL '\\N'", self.importer._pg_staging_copy_sql)
+
+        rows = [(16132, 'Октябрьский', '', None, float('nan'), 'a,b')]
+
+        # Fields matching the NULL marker are NULL, all others are taken as written
+        copied = [
+            tuple(None if field == '\\N' else field for field in row)
+            for row in csv.reader(_to_copy_csv(rows))
+        ]
+        self.assertEqual(copied, [('16132', 'Октябрьский', '', None, None, 'a,b')])
+
+    def trigger_names(self):
+        return {row[0] for row in self.fetch("SELECT name FROM sqlite_master WHERE type = 'trigger'")}
+
+    def test_bulk_import_restores_triggers(self):
+        """Test that a bulk import catches the derived tables up and restores their triggers."""
+        triggers = self.trigger_names()
+        with mock.patch('GeoDash.data.importer._BULK_IMPORT_MIN_BYTES', 0):
+            self.import_csv('v1.csv', CSV_V1)
+
+        self.assertEqual(self.trigger_names(), triggers)
+        self.assertEqual(self.fetch("SELECT id FROM city_rtree ORDER BY id"), [(1,), (2,)])
+
+        # Later writes are kept in sync by the restored triggers
+        with self.db_manager.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO city_data (id, name, ascii_name, country, country_code, lat, lng) "
+                "VALUES (3, 'Charlie', 'Charlie', '', 'TL', 10.2, 20.2)"
+            )
+        self.assertEqual(self.fetch("SELECT id FROM city_rtree ORDER BY id"), [(1,), (2,), (3,)])
+
+    def test_failed_index_rebuild_restores_triggers(self):
+        """Test that a failed catch-up still restores the triggers and fails the import."""
+        triggers = self.trigger_names()
+        broken = dict.fromkeys(('city_fts_insert', 'city_rtree_insert'), "INSERT INTO missing_table VALUES (1)")
+        with mock.patch('GeoDash.data.importer._BULK_IMPORT_MIN_BYTES', 0), \
+                mock.patch.dict('GeoDash.data.importer._SQLITE_DERIVED_TABLE_TRIGGERS', broken):
+            with self.assertRaises(DataImportError):
+                self.import_csv('v1.csv', CSV_V1)
+
+        self.assertEqual(self.trigger_names(), triggers)
+
+
+@unittest.skipUnless(importer.USING_PYARROW, "pyarrow is required for ADBC ingestion")
+class TestAdbcIngest(unittest.TestCase):
+    """Test cases for ingesting chunks into PostgreSQL through ADBC."""
+
+    def setUp(self):
+        """Create an importer for a stubbed PostgreSQL database and ADBC driver."""
+        db_manager = mock.Mock(
+            db_type='postgresql', db_uri='postgresql://geo@localhost/geodash',
+            connection_timeout=30, connection_options={'application_name': 'GeoDash'}
+        )
+        self.importer = CityDataImporter(db_manager)
+        self.driver = mock.MagicMock()
+        for patch in (
+            mock.patch.object(importer, 'USING_ADBC_POSTGRESQL', True),
+            mock.patch.object(importer, 'adbc_postgresql', self.driver, create=True),
+            mock.patch.object(self.importer, '_import_batch', side_effect=len)
+        ):
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.chunk = self.importer._standardize_columns(pd.read_csv(io.BytesIO(CSV_V1)))
+
+    def test_connection_reused_across_chunks(self):
+        """Test that one connection with the manager's options serves every chunk."""
+        for _ in range(3):
+            self.assertEqual(self.importer._import_dataframe(self.chunk, 1000), 2)
+
+        self.driver.connect.assert_called_once_with(
+            'postgresql://geo@localhost/geodash?connect_timeout=30&application_name=GeoDash'
+        )
+        self.importer._import_batch.assert_not_called()
+
+        self.importer._close_adbc_connections()
+        self.driver.connect.return_value.close.assert_called_once()
+
+    def test_failure_disables_adbc(self):
+        """Test that chunks after a failed ingest go straight to COPY."""
+        cursor = self.driver.connect.return_value.cursor.return_value.__enter__.return_value
+        cursor.adbc_ingest.side_effect = RuntimeError("duplicate key")
+
+        for _ in range(3):
+            self.assertEqual(self.importer._import_dataframe(self.chunk, 1000), 2)
+
+        cursor.adbc_ingest.assert_called_once()
+        self.driver.connect.return_value.rollback.assert_called_once()
+        self.assertEqual(self.importer._import_batch.call_count, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
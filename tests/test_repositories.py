@@ -0,0 +1,128 @@
+"""
+Tests for pagination and return types of the GeoDash repositories.
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from GeoDash.data.database import DatabaseManager
+from GeoDash.data.repositories import GeoRepository, RegionRepository
+from GeoDash.data.schema import SchemaManager
+
+# (id, name, state, country, lat, lng). Ids 4 and 2 share a point and ids
+# 6 and 3 share a name, so only the id tie-breaker fixes their order.
+CITIES = [
+    (1, 'Alpha', 'North', 'Testland', 10.00, 20.00),
+    (4, 'Bravo', 'North', 'Testland', 10.01, 20.00),
+    (2, 'Charlie', 'North', 'Testland', 10.01, 20.00),
+    (6, 'Delta', 'North', 'Testland', 10.03, 20.00),
+    (3, 'Delta', 'North', 'Testland', 10.04, 20.00),
+    (5, 'Echo', 'South', 'Testland', 10.05, 20.00),
+    (7, 'Foxtrot', 'East', 'Otherland', 40.00, 50.00),
+]
+
+
+class TestRepositoryPagination(unittest.TestCase):
+    """Test cases for limit/offset pagination and stable result ordering."""
+
+    def setUp(self):
+        """Create a SQLite database holding a few test cities."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_manager = DatabaseManager(f"sqlite:///{os.path.join(self.temp_dir, 'cities.db')}")
+        SchemaManager(self.db_manager).create_schema()
+
+        with self.db_manager.cursor() as cursor:
+            cursor.executemany(
+                "INSERT INTO city_data (id, name, ascii_name, state, country, country_code, lat, lng) "
+                "VALUES (?, ?, ?, ?, ?, 'TL', ?, ?)",
+                [(i, name, name, state, country, lat, lng) for i, name, state, country, lat, lng in CITIES]
+            )
+
+        self.geo_repository = GeoRepository(self.db_manager)
+        self.region_repository = RegionRepository(self.db_manager)
+
+    def tearDown(self):
+        """Remove the temporary database."""
+        self.db_manager.close()
+        shutil.rmtree(self.temp_dir)
+
+    def assert_coordinate_pages(self):
+        """Check radius search pages against the full, distance-ordered result."""
+        ids = [city['id'] for city in self.geo_repository.find_by_coordinates(10.0, 20.0, 50)]
+
+        # Equal distances are ordered by id
+        self.assertEqual(ids, [1, 2, 4, 6, 3, 5])
+
+        # Pages split the full result at their boundaries without gaps or overlap
+        pages = [
+            [city['id'] for city in self.geo_repository.find_by_coordinates(10.0, 20.0, 50, limit=2, offset=offset)]
+            for offset in (0, 2, 4)
+        ]
+        self.assertEqual(pages, [[1, 2], [4, 6], [3, 5]])
+
+        # A last page shorter than the limit, an offset without a limit, and
+        # an offset past the end
+        self.assertEqual(
+            [city['id'] for city in self.geo_repository.find_by_coordinates(10.0, 20.0, 50, limit=4, offset=4)],
+            [3, 5]
+        )
+        self.assertEqual(
+            [city['id'] for city in self.geo_repository.find_by_coordinates(10.0, 20.0, 50, offset=3)],
+            [6, 3, 5]
+        )
+        self.assertEqual(self.geo_repository.find_by_coordinates(10.0, 20.0, 50, limit=2, offset=6), [])
+        self.assertEqual(self.geo_repository.find_by_coordinates(10.0, 20.0, 50, limit=0), [])
+
+    def test_find_by_coordinates_pages(self):
+        """Test paginating a radius search with distances computed in SQL."""
+        self.assert_coordinate_pages()
+
+    def test_find_by_coordinates_pages_without_sql_math(self):
+        """Test paginating a radius search with distances computed in NumPy."""
+        self.geo_repository._sql_math = False
+        self.assert_coordinate_pages()
+
+    def test_find_by_coordinates_rejects_negative_pages(self):
+        """Test that negative limits and offsets are rejected."""
+        with self.assertRaises(ValueError):
+            self.geo_repository.find_by_coordinates(10.0, 20.0, 50, limit=-1)
+        with self.assertRaises(ValueError):
+            self.geo_repository.find_by_coordinates(10.0, 20.0, 50, offset=-1)
+
+    def test_get_cities_in_state_pages(self):
+        """Test paginating the cities of a state."""
+        cities = self.region_repository.get_cities_in_state('north', 'TESTLAND')
+
+        # Ordered by name, with the two Deltas ordered by id
+        self.assertEqual([city['id'] for city in cities], [1, 4, 2, 3, 6])
+
+        pages = [
+            [city['id'] for city in self.region_repository.get_cities_in_state('North', 'Testland', 2, offset)]
+            for offset in (0, 2, 4)
+        ]
+        self.assertEqual(pages, [[1, 4], [2, 3], [6]])
+
+        self.assertEqual(
+            [city['id'] for city in self.region_repository.get_cities_in_state('North', 'Testland', offset=3)],
+            [3, 6]
+        )
+        self.assertEqual(self.region_repository.get_cities_in_state('North', 'Testland', 10, 5), [])
+        self.assertEqual(self.region_repository.get_cities_in_state('North', 'Testland', 10, 50), [])
+
+    def test_countries_and_states_are_tuples(self):
+        """Test that country and state lists are returned as sorted tuples."""
+        countries = self.region_repository.get_countries()
+        self.assertIsInstance(countries, tuple)
+        self.assertEqual(countries, ('Otherland', 'Testland'))
+
+        states = self.region_repository.get_states('testland')
+        self.assertIsInstance(states, tuple)
+        self.assertEqual(states, ('North', 'South'))
+
+        self.assertEqual(self.region_repository.get_states('Nowhere'), ())
+
+
+if __name__ == "__main__":
+    unittest.main()